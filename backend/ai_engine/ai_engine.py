@@ -10,6 +10,7 @@ import time
 import re
 import os
 import json
+import logging
 import math
 from backend.risk_management.position_sizing import add_risk_management_to_strategy
 from datetime import datetime
@@ -19,6 +20,11 @@ from backend.ai_engine.strategy_explainer import generate_strategy_explainer
 
 print("📋 ai_engine.py: All imports finished.")
 
+# Debug dumps go through logging so their (large) payloads are only formatted
+# when enabled: AI_ENGINE_LOG_LEVEL=DEBUG turns them on
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv("AI_ENGINE_LOG_LEVEL", "INFO").upper())
+
 
 from typing import Optional
 from backend.openai_config import OPENAI_API_KEY, GPT_MODEL
@@ -654,7 +660,7 @@ def run_ai_engine(
 ) -> dict:
     start_time = time.time()  # ADD THIS LINE HERE
     parsed = parse_belief(belief)
-    print(f"[DEBUG] CREATIVE_MAPPING will_run={os.getenv('CREATIVE_MAPPING')} parsed_ticker_before={parsed.get('ticker')}")
+    logger.debug("CREATIVE_MAPPING will_run=%s parsed_ticker_before=%s", os.getenv("CREATIVE_MAPPING"), parsed.get("ticker"))
 
     # --- Creative Mapping (feature-flagged; safe by default) ---
     try:
@@ -674,7 +680,7 @@ def run_ai_engine(
                 parsed["ticker"] = best["symbol"]
                 ticker = parsed["ticker"]  # Update local variable immediately
                 print(f"[CREATIVE MAPPING] applied {best}")
-                print(f"[DEBUG] CREATIVE_MAPPING applied: {best}")
+                logger.debug("CREATIVE_MAPPING applied: %s", best)
                 parsed.setdefault("tags", []).append("creative-mapped")
                 parsed.setdefault("explanation_notes", []).append(
                     f"Creative mapping: {best['symbol']} (score={best['score']}). {best.get('why','')}"
@@ -824,8 +830,8 @@ def run_ai_engine(
 
             try:
                 gpt_strategy = parse_strategy_json(gpt_raw_output)
-                print("\n🧠 [GPT-4 Strategy Output for Comparison Only]:")
-                print(json.dumps(gpt_strategy, indent=2))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🧠 [GPT-4 Strategy Output for Comparison Only]:\n%s", json.dumps(gpt_strategy, indent=2))
 
                 # === 🧠 Auto-patch straddle/strangle based on explanation text ===
                 explanation = gpt_strategy.get("explanation", "").lower()
@@ -995,35 +1001,36 @@ def run_ai_engine(
 
 
 
-    # ✅ DEBUG — Log final strategy output for visibility
-    print("[DEBUG] Final strategy output:")
-    print(
-        json.dumps(
-            {
-                "strategy": strategy,
-                "ticker": ticker,
-                "asset_class": asset_class,
-                "tags": tags,
-                "direction": direction,
-                "price_info": price_info,
-                "high_low": [clean_float(high_low[0]), clean_float(high_low[1])],
-                "confidence": confidence,
-                "goal_type": goal_type,
-                "multiplier": multiplier,
-                "timeframe": timeframe,
-                "expiry_date": strategy.get("expiration"),
-                "risk_profile": risk_profile,
-                "explanation": explanation,
-                "user_id": user_id,
-                "validator": validation,
-                "valid": validation.get("valid"),
-                "would_profit": validation.get("would_profit"),
-                "estimated_profit_pct": validation.get("estimated_profit_pct"),
-                "notes": validation.get("notes"),
-            },
-            indent=2,
+    # ✅ DEBUG — Log final strategy output for visibility (skipped entirely unless enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Final strategy output:\n%s",
+            json.dumps(
+                {
+                    "strategy": strategy,
+                    "ticker": ticker,
+                    "asset_class": asset_class,
+                    "tags": tags,
+                    "direction": direction,
+                    "price_info": price_info,
+                    "high_low": [clean_float(high_low[0]), clean_float(high_low[1])],
+                    "confidence": confidence,
+                    "goal_type": goal_type,
+                    "multiplier": multiplier,
+                    "timeframe": timeframe,
+                    "expiry_date": strategy.get("expiration"),
+                    "risk_profile": risk_profile,
+                    "explanation": explanation,
+                    "user_id": user_id,
+                    "validator": validation,
+                    "valid": validation.get("valid"),
+                    "would_profit": validation.get("would_profit"),
+                    "estimated_profit_pct": validation.get("estimated_profit_pct"),
+                    "notes": validation.get("notes"),
+                },
+                indent=2,
+            ),
         )
-    )
     # Add dynamic fields based on asset class
     print("📋 CHECKPOINT: About to add dynamic fields!")
     asset_specific_fields = add_dynamic_fields(asset_class, strategy, ticker, price_info)
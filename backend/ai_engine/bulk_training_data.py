@@ -17,15 +17,22 @@ BELIEF_TEMPLATES = [
     ("Crypto adoption accelerating", ["long crypto", "bull call spread"])
 ]
 
+ASSET_CLASSES = ["options", "crypto", "futures", "stocks", "bonds", "forex"]
+
+# Each template's three phrasings, built once instead of per generated row
+_BELIEF_VARIANTS = [
+    ((template, f"I believe {template.lower()}", f"Expecting {template.lower()}"), strategies)
+    for template, strategies in BELIEF_TEMPLATES
+]
+
 def generate_data(n=150):
-    data = []
-    for _ in range(n):
-        belief_template, strategies = random.choice(BELIEF_TEMPLATES)
-        belief = random.choice([belief_template, f"I believe {belief_template.lower()}", f"Expecting {belief_template.lower()}"])
-        strategy = random.choice(strategies)
-        asset = random.choice(["options", "crypto", "futures", "stocks", "bonds", "forex"])
-        data.append([belief, strategy, asset])
-    return data
+    # Templates and asset classes for all rows drawn in one call each
+    templates = random.choices(_BELIEF_VARIANTS, k=n)
+    assets = random.choices(ASSET_CLASSES, k=n)
+    return [
+        [random.choice(variants), random.choice(strategies), asset]
+        for (variants, strategies), asset in zip(templates, assets)
+    ]
 
 if __name__ == "__main__":
     data = generate_data(150)
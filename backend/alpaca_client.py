@@ -2,10 +2,11 @@
 # ✅ Alpaca API client using .env and logs outcomes
 
 import os
-import requests
 import random
 from dotenv import load_dotenv
 
+from backend.utils.http_session import build_session
+
 # 🔁 Load environment variables from .env
 load_dotenv()
 
@@ -20,6 +21,12 @@ HEADERS = {
     "APCA-API-SECRET-KEY": ALPACA_SECRET_KEY,
 }
 
+# Pooled keep-alive connection to the Alpaca trading API (account, order,
+# order-status calls share it). retries=0: an order POST is never re-sent.
+# No status_forcelist either, so a 5xx comes back as a response (as with plain
+# requests) instead of raising RetryError.
+_SESSION = build_session(pool_connections=1, pool_maxsize=4, retries=0, status_forcelist=())
+
 # 🧠 Import strategy outcome logger
 from backend.strategy_outcome_logger import log_strategy_outcome
 
@@ -29,7 +36,7 @@ def get_account_info():
     Fetches account details from Alpaca.
     """
     try:
-        response = requests.get(f"{ALPACA_BASE_URL}/v2/account", headers=HEADERS)
+        response = _SESSION.get(f"{ALPACA_BASE_URL}/v2/account", headers=HEADERS)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -56,7 +63,7 @@ def submit_market_buy(ticker: str, qty: int, belief: str = None, strategy: dict
             "time_in_force": "gtc"
         }
 
-        response = requests.post(f"{ALPACA_BASE_URL}/v2/orders", json=order, headers=HEADERS)
+        response = _SESSION.post(f"{ALPACA_BASE_URL}/v2/orders", json=order, headers=HEADERS)
         response.raise_for_status()
         order_data = response.json()
 
@@ -88,7 +95,7 @@ def get_order_status(order_id: str):
     Fetches status of a specific order by ID.
     """
     try:
-        response = requests.get(f"{ALPACA_BASE_URL}/v2/orders/{order_id}", headers=HEADERS)
+        response = _SESSION.get(f"{ALPACA_BASE_URL}/v2/orders/{order_id}", headers=HEADERS)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -5,10 +5,10 @@ Alpaca Order Handler:
 """
 
 import os
-import requests
 from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 from backend.broker_interface import BrokerInterface  # Interface for all brokers
+from backend.utils.http_session import build_session
 
 # === Load .env for Render and local use ===
 dotenv_path = os.path.join(os.getcwd(), ".env")
@@ -23,6 +23,12 @@ HEADERS = {
     "APCA-API-SECRET-KEY": ALPACA_SECRET_KEY,
 }
 
+# Pooled keep-alive connections to the Alpaca trading API (multi-leg orders
+# post several times in a row). retries=0: an order POST is never re-sent.
+# No status_forcelist either, so a 5xx comes back as a response (as with plain
+# requests) instead of raising RetryError.
+_SESSION = build_session(pool_connections=1, pool_maxsize=4, retries=0, status_forcelist=())
+
 # Debug load confirmation
 print("ALPACA_API_KEY loaded:", "✅" if ALPACA_API_KEY else "❌ MISSING")
 print("ALPACA_SECRET_KEY loaded:", "✅" if ALPACA_SECRET_KEY else "❌ MISSING")
@@ -152,7 +158,7 @@ class AlpacaExecutor(BrokerInterface):
 
                 url = f"{ALPACA_BASE_URL}/v2/orders"
                 print(f"Alpaca STOCK order payload (normalized): {order}")
-                response = requests.post(url, headers=HEADERS, json=order)
+                response = _SESSION.post(url, headers=HEADERS, json=order)
                 # If Alpaca rejects the order, capture its response body for debugging
                 if response.status_code >= 400:
                     try:
@@ -190,7 +196,7 @@ class AlpacaExecutor(BrokerInterface):
                 print(f"Normalization failed ({ve}); using legacy stock payload: {legacy_payload}")
                 try:
                     url = f"{ALPACA_BASE_URL}/v2/orders"
-                    response = requests.post(url, headers=HEADERS, json=legacy_payload)
+                    response = _SESSION.post(url, headers=HEADERS, json=legacy_payload)
                     response.raise_for_status()
                     return {
                         "status": "success",
@@ -256,7 +262,7 @@ class AlpacaExecutor(BrokerInterface):
 
                     print(f"Alpaca OPTIONS order payload: {order_payload}")
                     url = f"{ALPACA_BASE_URL}/v1beta1/options/orders"
-                    response = requests.post(url, headers=HEADERS, json=order_payload)
+                    response = _SESSION.post(url, headers=HEADERS, json=order_payload)
                     response.raise_for_status()
                     orders.append(response.json())
 
@@ -294,7 +300,7 @@ def get_all_orders(status: str = "all", limit: int = 100):
     try:
         url = f"{ALPACA_BASE_URL}/v2/orders"
         params = {"status": status, "limit": limit, "direction": "desc"}
-        response = requests.get(url, headers=HEADERS, params=params)
+        response = _SESSION.get(url, headers=HEADERS, params=params)
         response.raise_for_status()
         return response.json()
     except Exception as e:
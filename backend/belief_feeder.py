@@ -13,89 +13,284 @@ import time
 import random
 import csv
 import os
+import re
 import hashlib
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import feedparser
 
+from minimal_rss import parse_top_chunks
+from news_config import FALLBACK_BELIEF, FEED_USER_AGENT, MARKET_RSS_FEEDS
 from train_all_models import train_all_models
+from utils.http_session import get_session
 
 # === CONFIG ===
-RSS_FEEDS = [
-    "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",
-    "https://www.marketwatch.com/rss/topstories",
-    "https://www.cnbc.com/id/100003114/device/rss/rss.html",
-]
-TAGS = ["bullish", "bearish", "neutral", "volatility", "rate_sensitive"]
+RSS_FEEDS = MARKET_RSS_FEEDS
+TAGS = ("bullish", "bearish", "neutral", "volatility", "rate_sensitive")
 BELIEF_CSV_PATH = "backend/training_data/clean_belief_tags.csv"
 LOG_PATH = "backend/logs/last_training_log.txt"
+FINGERPRINT_PATH = "backend/logs/last_fingerprint.json"
+SEEN_HEADLINES_PATH = "backend/logs/seen_headlines.json"
+FEED_META_PATH = "backend/logs/feed_meta.json"
+SEEN_HEADLINES_MAX = 2048
+FEED_ENTRY_LIMIT = 10
+FEED_CHUNK_BYTES = 16 * 1024
+FEED_TIMEOUT_SECONDS = 10
+MIN_RETRAIN_INTERVAL = int(os.getenv("FEEDER_MIN_RETRAIN_SECONDS", "1800"))
+BELIEF_TEMPLATES = (
+    "I believe {line}",
+    "This matters: {line}",
+    "The market might react to this: {line}",
+    "Should I act on this? {line}",
+    "Does this mean something big? {line}",
+    "Based on this news: {line}",
+)
+# Split once at import so building a belief is plain concatenation, not str.format
+_TEMPLATE_PARTS = tuple(tuple(t.split("{line}", 1)) for t in BELIEF_TEMPLATES)
 RELEVANT_KEYWORDS = [
     "stock", "stocks", "market", "markets", "fed", "interest", "inflation", "AI",
     "bond", "crypto", "bitcoin", "nasdaq", "dow", "s&p", "apple", "nvidia",
     "tesla", "google", "amazon", "earnings", "economy", "oil", "gold"
 ]
+# One lowercase alternation: a single scan per headline instead of lowering the
+# text once per keyword (same substring semantics as the old any(...) check)
+_RELEVANT_RE = re.compile("|".join(re.escape(k.lower()) for k in RELEVANT_KEYWORDS))
 
 # === SETUP ON STARTUP ===
 os.makedirs(os.path.dirname(BELIEF_CSV_PATH), exist_ok=True)
 os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
 
-def fetch_headlines_with_summaries():
+def load_feed_meta():
+    try:
+        with open(FEED_META_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_feed_meta(feed_meta):
+    tmp_path = FEED_META_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(feed_meta, f)
+    os.replace(tmp_path, FEED_META_PATH)
+
+def _fetch_feed_lines(url, cached=None):
+    """
+    Returns (lines, validators, not_modified) for one feed. `cached` holds the
+    ETag/Last-Modified and extracted lines from the previous fetch; unchanged
+    feeds answer 304 and their cached lines are returned without a download.
+    """
+    cached = cached or {}
+    lines = []
+    headers = {"User-Agent": FEED_USER_AGENT}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    try:
+        # Streamed: only the first FEED_ENTRY_LIMIT entries are read, so the
+        # download stops there instead of pulling the whole feed
+        with get_session().get(url, headers=headers, timeout=FEED_TIMEOUT_SECONDS, stream=True) as resp:
+            if resp.status_code == 304:
+                return list(cached.get("lines", [])), cached, True
+            resp.raise_for_status()
+            entries = parse_top_chunks(
+                resp.iter_content(FEED_CHUNK_BYTES), FEED_ENTRY_LIMIT, resp.headers.get("Content-Type", "")
+            )
+        for entry in entries:
+            title, summary = entry["title"], entry["summary"]
+            if not title or len(title) < 10:
+                continue
+            # parse_top strips both fields, so the line is built in one step
+            # (same text the old (title + ". " + summary).strip() produced)
+            full_text = f"{title}. {summary}" if summary else title + "."
+            if _RELEVANT_RE.search(full_text.lower()):
+                lines.append(full_text)
+        validators = {
+            "etag": resp.headers.get("ETag"),
+            "modified": resp.headers.get("Last-Modified"),
+            "lines": lines,  # persisted in FEED_META_PATH, served again on a 304
+        }
+        return lines, validators, False
+    except Exception as e:
+        print(f"⚠️ Failed to parse feed: {url}\n{e}")
+        return lines, cached, False
+
+def fetch_headlines_with_summaries(feed_meta=None):
+    """
+    Fetches all feeds concurrently (network-bound); results keep RSS_FEEDS order.
+    When `feed_meta` is given, conditional GETs are sent and the dict is
+    updated in place; unchanged feeds contribute their cached lines, so the
+    headline set (and its fingerprint) doesn't depend on which feeds changed.
+    Returns (lines, number of feeds unchanged since last fetch).
+    """
+    feed_meta = {} if feed_meta is None else feed_meta
     combined = []
-    for url in RSS_FEEDS:
+    unchanged = 0
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+        results = executor.map(_fetch_feed_lines, RSS_FEEDS, [feed_meta.get(u) for u in RSS_FEEDS])
+        for url, (lines, validators, not_modified) in zip(RSS_FEEDS, results):
+            combined.extend(lines)
+            unchanged += not_modified
+            feed_meta[url] = validators
+    return combined, unchanged
+
+class SeenHeadlines:
+    """
+    Bounded FIFO set of headline digests seen in earlier cycles, persisted to
+    SEEN_HEADLINES_PATH so repeats are skipped across restarts too.
+    """
+
+    def __init__(self, path=SEEN_HEADLINES_PATH, maxlen=SEEN_HEADLINES_MAX):
+        self.path = path
+        self._fifo = deque(maxlen=maxlen)
+        self._set = set()
         try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:10]:
-                title = entry.title.strip() if hasattr(entry, "title") else ""
-                summary = entry.summary.strip() if hasattr(entry, "summary") else ""
-                if not title or len(title) < 10:
-                    continue
-                full_text = f"{title}. {summary}".strip()
-                if any(k.lower() in full_text.lower() for k in RELEVANT_KEYWORDS):
-                    combined.append(full_text)
-        except Exception as e:
-            print(f"⚠️ Failed to parse feed: {url}\n{e}")
-            continue
-    return combined
+            with open(path, "r") as f:
+                for digest in json.load(f)[-maxlen:]:
+                    self._remember(digest)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    @staticmethod
+    def digest(line: str) -> str:
+        return hashlib.md5(line.encode("utf-8")).hexdigest()[:16]
+
+    def _remember(self, digest):
+        if len(self._fifo) == self._fifo.maxlen:
+            self._set.discard(self._fifo[0])
+        self._fifo.append(digest)
+        self._set.add(digest)
+
+    def filter_new(self, lines):
+        """
+        Returns (fresh lines, their digests) without recording them; call
+        remember() once the lines have been stored, so a failed cycle
+        retries them instead of treating them as seen.
+        """
+        fresh, digests = [], []
+        batch = set()  # repeats within this batch
+        for line in lines:
+            digest = self.digest(line)
+            if digest in self._set or digest in batch:
+                continue
+            batch.add(digest)
+            fresh.append(line)
+            digests.append(digest)
+        return fresh, digests
+
+    def remember(self, digests):
+        for digest in digests:
+            self._remember(digest)
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(list(self._fifo), f)
+        os.replace(tmp_path, self.path)
 
 def convert_to_beliefs(lines):
-    templates = [
-        "I believe {line}",
-        "This matters: {line}",
-        "The market might react to this: {line}",
-        "Should I act on this? {line}",
-        "Does this mean something big? {line}",
-        "Based on this news: {line}"
-    ]
-    return [random.choice(templates).format(line=l) for l in lines]
+    # Draw every template for the cycle in one random.choices call
+    parts = random.choices(_TEMPLATE_PARTS, k=len(lines))
+    return [prefix + line + suffix for line, (prefix, suffix) in zip(lines, parts)]
 
 def hash_belief(belief: str) -> str:
     return hashlib.md5(belief.encode("utf-8")).hexdigest()
 
+# Hash set of the CSV as of its last known (size, mtime); reused across cycles
+_belief_hash_cache = {"path": None, "stat": None, "hashes": set()}
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
 def load_existing_belief_hashes(path=BELIEF_CSV_PATH):
+    """
+    Returns the hashes of every belief in `path`. The CSV is only re-read
+    when it changed since the last call (e.g. edited by another worker);
+    otherwise the in-memory set from the previous cycle is reused.
+    """
     if not os.path.exists(path):
         return set()
+    stamp = _file_stamp(path)
+    if _belief_hash_cache["path"] == path and _belief_hash_cache["stat"] == stamp:
+        return _belief_hash_cache["hashes"]
     with open(path, mode="r", newline='') as f:
         reader = csv.DictReader(f)
-        return set(hash_belief(row["belief"]) for row in reader if "belief" in row)
+        hashes = set(hash_belief(row["belief"]) for row in reader if "belief" in row)
+    _belief_hash_cache.update(path=path, stat=stamp, hashes=hashes)
+    return hashes
+
+_CSV_SPECIALS = (",", '"', "\r", "\n")
+
+def _csv_line(fields) -> str:
+    """
+    One CSV row, byte-identical to csv.writer's default dialect (minimal
+    quoting, CRLF line ending), built with a plain join.
+    """
+    out = []
+    for field in fields:
+        if any(c in field for c in _CSV_SPECIALS):
+            field = '"' + field.replace('"', '""') + '"'
+        out.append(field)
+    return ",".join(out) + "\r\n"
 
 def append_new_beliefs(beliefs, path=BELIEF_CSV_PATH):
     existing_hashes = load_existing_belief_hashes(path)
-    new_entries = [(b, hash_belief(b)) for b in beliefs if hash_belief(b) not in existing_hashes]
+    new_beliefs = [b for b in beliefs if hash_belief(b) not in existing_hashes]
 
-    if not new_entries:
+    if not new_beliefs:
         print(f"[{datetime.now()}] ⚠️ No new beliefs to add.")
         return 0
 
+    # Build every row in memory, then append them as one string
+    tags = random.choices(TAGS, k=len(new_beliefs))
+    rows = [[belief, tag] for belief, tag in zip(new_beliefs, tags)]
+
     file_exists = os.path.isfile(path)
+    chunk = "".join(_csv_line(row) for row in rows)
     with open(path, mode="a", newline='') as f:
-        writer = csv.writer(f)
         if not file_exists:
-            writer.writerow(["belief", "tag"])
-        for belief, _ in new_entries:
-            tag = random.choice(TAGS)
-            writer.writerow([belief, tag])
-            print(f"➕ Saved: {belief[:80]}... [{tag}]")
-    print(f"[{datetime.now()}] ✅ Added {len(new_entries)} new beliefs.")
-    return len(new_entries)
+            f.write(_csv_line(["belief", "tag"]))
+        f.write(chunk)
+
+    # Keep the cached set in step with what was just written
+    if _belief_hash_cache["path"] == path:
+        _belief_hash_cache["hashes"].update(hash_belief(b) for b in new_beliefs)
+        _belief_hash_cache["stat"] = _file_stamp(path)
+
+    for belief, tag in rows:
+        print(f"➕ Saved: {belief[:80]}... [{tag}]")
+    print(f"[{datetime.now()}] ✅ Added {len(rows)} new beliefs.")
+    return len(rows)
+
+def headline_fingerprint(lines) -> str:
+    # Order-independent hash of the fetched headlines (templates are random,
+    # so beliefs themselves change every cycle even for identical news)
+    return hashlib.sha256("\n".join(sorted(lines)).encode("utf-8")).hexdigest()
+
+def load_retrain_marker():
+    try:
+        with open(FINGERPRINT_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"fingerprint": None, "retrained_at": 0}
+
+def save_retrain_marker(marker):
+    tmp_path = FINGERPRINT_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(marker, f)
+    os.replace(tmp_path, FINGERPRINT_PATH)
+
+def should_retrain(marker, fingerprint, new_count) -> bool:
+    """
+    Retrain only when new beliefs landed, the headline set differs from the
+    one last trained on, and MIN_RETRAIN_INTERVAL has elapsed. The marker is
+    persisted, so a restart doesn't trigger a spurious retrain.
+    """
+    if new_count <= 0 or fingerprint == marker.get("fingerprint"):
+        return False
+    return time.time() - marker.get("retrained_at", 0) >= MIN_RETRAIN_INTERVAL
 
 def write_log(timestamp, fetched, generated, new_count, retrained):
     with open(LOG_PATH, "w") as f:
@@ -106,33 +301,51 @@ def write_log(timestamp, fetched, generated, new_count, retrained):
         f.write("✅ Models retrained.\n" if retrained else "⏩ Skipped retraining.\n")
 
 def run_feeder_loop(interval=3600):
+    retrain_marker = load_retrain_marker()
+    seen_headlines = SeenHeadlines()
+    feed_meta = load_feed_meta()
     while True:
         timestamp = datetime.now()
         print(f"\n📰 [News Ingestor] {timestamp}")
 
         try:
-            raw_lines = fetch_headlines_with_summaries()
-            print(f"🔍 {len(raw_lines)} headlines fetched")
+            # Validators and seen-headlines are committed only after the
+            # beliefs are appended: if this cycle fails, the next one
+            # re-fetches and retries the same headlines
+            cycle_meta = dict(feed_meta)
+            raw_lines, unchanged_feeds = fetch_headlines_with_summaries(cycle_meta)
+            fresh_lines, fresh_digests = seen_headlines.filter_new(raw_lines)
+            print(f"🔍 {len(raw_lines)} headlines fetched ({len(fresh_lines)} not seen before, "
+                  f"{unchanged_feeds} feeds unchanged)")
 
-            beliefs = convert_to_beliefs(raw_lines)
+            beliefs = convert_to_beliefs(fresh_lines)
             print(f"🧠 {len(beliefs)} belief prompts generated")
 
-            if not beliefs:
+            if not raw_lines and not unchanged_feeds:
                 print("⚠️ No beliefs found. Using fallback.")
-                beliefs = ["I believe the market may react to rising uncertainty."]
+                beliefs = [FALLBACK_BELIEF]
 
             new_count = append_new_beliefs(beliefs)
+            seen_headlines.remember(fresh_digests)
+            feed_meta = cycle_meta
+            save_feed_meta(feed_meta)
             retrained = False
 
-            if new_count > 0:
+            fingerprint = headline_fingerprint(raw_lines)
+            if should_retrain(retrain_marker, fingerprint, new_count):
                 try:
                     print("🔁 Starting retraining...")
                     train_all_models()
                     retrained = True
+                    retrain_marker = {"fingerprint": fingerprint, "retrained_at": time.time()}
+                    save_retrain_marker(retrain_marker)
                     print("✅ Retraining complete")
                 except Exception as e:
                     print(f"❌ Model training failed: {e}")
+            elif new_count > 0:
+                print("⏳ Retraining throttled (same headlines or cooldown active)")
 
+            seen_headlines.save()
             write_log(timestamp, len(raw_lines), len(beliefs), new_count, retrained)
 
         except Exception as e:
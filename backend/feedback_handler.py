@@ -103,15 +103,31 @@ def save_feedback(belief: str, strategy: str, feedback: str = None, user_id: str
     
     print(f"✅ Feedback saved to file for user: {user_id}")
 
-def save_feedback(belief: str, strategy: str, feedback: str = None, user_id: str = "anonymous", **kwargs):
+def _outcome_row(timestamp: str, user_id: str, belief: str, strategy, feedback: str, kwargs: dict) -> list:
+    return [
+        timestamp,
+        user_id,
+        belief,
+        strategy,
+        kwargs.get("ticker", "N/A"),
+        kwargs.get("pnl_percent", "N/A"),
+        feedback,
+        kwargs.get("risk", "moderate"),
+        kwargs.get("holding_period_days", "N/A"),
+        kwargs.get("notes", ""),
+        ",".join(kwargs.get("tags", [])) if isinstance(kwargs.get("tags"), list) else kwargs.get("tags", "")
+    ]
+
+def save_feedback_batch(items, feedback: str = None, user_id: str = "anonymous", **kwargs):
     """
-    ✅ Saves user feedback and any extra metadata to JSON.
-    Accepts optional args like:
-    - feedback (explicit or predicted)
-    - user_id
-    - confidence
-    - source
+    ✅ Saves many (belief, strategy) pairs with one JSON rewrite and one
+    strategy_outcomes.csv append for the whole batch, instead of a full
+    read-modify-write per entry. Same fields/metadata as save_feedback.
     """
+    items = list(items)
+    if not items:
+        return
+
     data = []
 
     if os.path.exists(FEEDBACK_FILE):
@@ -122,47 +138,49 @@ def save_feedback(belief: str, strategy: str, feedback: str = None, user_id: str
                 print("⚠️ JSON decode error — starting fresh.")
                 data = []
 
-    if not feedback:
-        feedback = predict_feedback_label(belief, strategy)
-
-    feedback_entry = {
-        "timestamp": datetime.utcnow().isoformat(),
-        "user_id": user_id,
-        "belief": belief,
-        "strategy": strategy,
-        "result": feedback
-    }
-
-    # ✅ Merge any additional metadata into entry (like confidence, source)
-    feedback_entry.update(kwargs)
+    # One timestamp for the whole batch: entries are written in the same tick
+    timestamp = datetime.utcnow().isoformat()
+    rows = []
+    for belief, strategy in items:
+        result = feedback or predict_feedback_label(belief, strategy)
+        feedback_entry = {
+            "timestamp": timestamp,
+            "user_id": user_id,
+            "belief": belief,
+            "strategy": strategy,
+            "result": result
+        }
+
+        # ✅ Merge any additional metadata into entry (like confidence, source)
+        feedback_entry.update(kwargs)
+
+        data.append(feedback_entry)
+        rows.append(_outcome_row(timestamp, user_id, belief, strategy, result, kwargs))
 
-    data.append(feedback_entry)
     with open(FEEDBACK_FILE, "w") as f:
         json.dump(data, f, indent=2)
 
     # ✅ Append to strategy_outcomes.csv if possible
     try:
         with open(CSV_FILE, mode="a", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([
-                datetime.utcnow().isoformat(),
-                user_id,
-                belief,
-                strategy,
-                kwargs.get("ticker", "N/A"),
-                kwargs.get("pnl_percent", "N/A"),
-                feedback,
-                kwargs.get("risk", "moderate"),
-                kwargs.get("holding_period_days", "N/A"),
-                kwargs.get("notes", ""),
-                ",".join(kwargs.get("tags", [])) if isinstance(kwargs.get("tags"), list) else kwargs.get("tags", "")
-            ])
-            print("🟩 Feedback also appended to strategy_outcomes.csv")
+            csv.writer(csvfile).writerows(rows)
+            print(f"🟩 Feedback also appended to strategy_outcomes.csv ({len(rows)} rows)")
     except Exception as e:
         print(f"⚠️ Could not write to strategy_outcomes.csv: {e}")
 
     print(f"✅ Feedback saved to file for user: {user_id}")
 
+def save_feedback(belief: str, strategy: str, feedback: str = None, user_id: str = "anonymous", **kwargs):
+    """
+    ✅ Saves user feedback and any extra metadata to JSON.
+    Accepts optional args like:
+    - feedback (explicit or predicted)
+    - user_id
+    - confidence
+    - source
+    """
+    save_feedback_batch([(belief, strategy)], feedback=feedback, user_id=user_id, **kwargs)
+
 def save_feedback_entry(belief: str, strategy: str, result: str = None, user_id: str = "anonymous", **kwargs):
     """
     ✅ Adaptive alias to support legacy and upgraded feedback entry logic.
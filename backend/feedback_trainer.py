@@ -106,31 +106,43 @@ def train_strategy_classifier_from_feedback():
     print("✅ Trained and saved feedback_strategy_model + vectorizer")
 
 # === Append new feedback entry to feedback_data.json ===
-def append_feedback_entry(belief, strategy, result):
+def append_feedback_entries(entries):
     """
-    Appends a feedback record for learning.
+    Appends many feedback records with one read and one rewrite of the
+    feedback file, instead of a full rewrite per record.
 
     Params:
-    - belief (str): User belief input
-    - strategy (dict): Generated strategy object
-    - result (str): 'good' or 'bad'
+    - entries: iterable of (belief, strategy, result) tuples
     """
-    entry = {
-        "belief": belief,
-        "strategy": strategy,
-        "result": result
-    }
+    new_entries = [
+        {"belief": belief, "strategy": strategy, "result": result}
+        for belief, strategy, result in entries
+    ]
+    if not new_entries:
+        return
 
     # Load existing data
     with open(FEEDBACK_FILE, "r") as f:
         existing = json.load(f)
 
     # Append and save
-    existing.append(entry)
+    existing.extend(new_entries)
     with open(FEEDBACK_FILE, "w") as f:
         json.dump(existing, f, indent=2)
 
-    print(f"📥 Appended feedback entry: {result.upper()} → {belief}")
+    for entry in new_entries:
+        print(f"📥 Appended feedback entry: {entry['result'].upper()} → {entry['belief']}")
+
+def append_feedback_entry(belief, strategy, result):
+    """
+    Appends a feedback record for learning.
+
+    Params:
+    - belief (str): User belief input
+    - strategy (dict): Generated strategy object
+    - result (str): 'good' or 'bad'
+    """
+    append_feedback_entries([(belief, strategy, result)])
 
 # === Run both training routines directly from CLI ===
 if __name__ == "__main__":
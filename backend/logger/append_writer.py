@@ -0,0 +1,184 @@
+# backend/logger/append_writer.py
+
+"""
+Crash-safe append writer shared by the file loggers.
+
+Every entry is assembled into a single bytes object and written with one
+os.write() on a descriptor opened with O_APPEND. O_APPEND places each write
+at the current end of file, so concurrent workers never overwrite each
+other, and this process never splits an entry across write calls (a short
+write is only continued after a signal or a full disk).
+
+If the file is rotated, deleted or replaced (os.replace) while the writer
+holds it open, the next write notices the inode change and reopens the path,
+so entries don't vanish into the unlinked file.
+
+CSV headers go through write(data, header=...): the header is written only
+if the file is empty, checked and written under an exclusive flock so two
+processes can't both write it. is_empty() on its own has no such guarantee.
+
+Durability is tunable through environment variables:
+- LOG_FSYNC_EVERY_N       fsync after every N entries (0 = disabled, default)
+- LOG_FSYNC_INTERVAL_SEC  background fsync cadence in seconds (0 = disabled, default 1.0)
+"""
+
+import atexit
+import os
+import threading
+from typing import Dict
+
+try:
+    import fcntl  # header-write lock (POSIX)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+FSYNC_EVERY_N = int(os.getenv("LOG_FSYNC_EVERY_N", "0"))
+FSYNC_INTERVAL_SEC = float(os.getenv("LOG_FSYNC_INTERVAL_SEC", "1.0"))
+
+_WRITERS: Dict[str, "AppendWriter"] = {}
+_REGISTRY_LOCK = threading.Lock()
+_SYNC_THREAD = None
+_STOP = threading.Event()
+
+
+class AppendWriter:
+    """
+    Append-only writer around a single O_APPEND file descriptor.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fd = self._open()
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def _open(self) -> int:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _current_fd(self) -> int:
+        """
+        Descriptor for the file now at self.path (caller holds self._lock).
+        Reopens when the file was rotated, deleted or replaced since it was
+        opened; anything pending on the old descriptor is fsynced first.
+        """
+        held = os.fstat(self.fd)
+        try:
+            on_disk = os.stat(self.path)
+            if (on_disk.st_ino, on_disk.st_dev) == (held.st_ino, held.st_dev):
+                return self.fd
+        except FileNotFoundError:
+            pass
+        old_fd, self.fd = self.fd, self._open()
+        try:
+            if self._pending:
+                os.fsync(old_fd)
+        except OSError as e:
+            print(f"[LOGGER ERROR] fsync failed for {self.path}: {e}")
+        finally:
+            os.close(old_fd)
+        self._pending = 0
+        return self.fd
+
+    def is_empty(self) -> bool:
+        """
+        True when nothing has been written to the file yet. Only a snapshot:
+        another process may append right after, so CSV headers should be
+        passed to write(header=...) instead of checked here.
+        """
+        with self._lock:
+            return os.fstat(self._current_fd()).st_size == 0
+
+    def write(self, data: bytes, header: bytes = b""):
+        """
+        Append one pre-assembled entry with a single write syscall. `header`
+        (e.g. a CSV header row) is prepended when the file is still empty;
+        the check and the write then run under an exclusive flock.
+        """
+        with self._lock:
+            fd = self._current_fd()
+            if header:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    if os.fstat(fd).st_size == 0:
+                        data = header + data
+                    _write_all(fd, data)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                _write_all(fd, data)
+            self._pending += 1
+            due = FSYNC_EVERY_N > 0 and self._pending >= FSYNC_EVERY_N
+        if due:
+            self.sync()
+
+    def sync(self):
+        """fsync the descriptor if anything was written since the last sync."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._pending = 0
+            try:
+                os.fsync(self.fd)
+            except OSError as e:
+                print(f"[LOGGER ERROR] fsync failed for {self.path}: {e}")
+
+    def close(self):
+        self.sync()
+        with self._lock:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _sync_loop():
+    while not _STOP.wait(FSYNC_INTERVAL_SEC):
+        sync_all()
+
+
+def sync_all():
+    """fsync every open writer that has unsynced entries."""
+    with _REGISTRY_LOCK:
+        writers = list(_WRITERS.values())
+    for writer in writers:
+        writer.sync()
+
+
+def get_writer(path: str) -> AppendWriter:
+    """
+    Returns the process-wide writer for `path`, opening it on first use and
+    starting the background fsync thread when an interval is configured.
+    """
+    global _SYNC_THREAD
+    key = os.path.abspath(path)
+    with _REGISTRY_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = AppendWriter(key)
+            _WRITERS[key] = writer
+        if _SYNC_THREAD is None and FSYNC_INTERVAL_SEC > 0:
+            _SYNC_THREAD = threading.Thread(target=_sync_loop, name="log-fsync", daemon=True)
+            _SYNC_THREAD.start()
+    return writer
+
+
+@atexit.register
+def _close_all():
+    _STOP.set()
+    with _REGISTRY_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for writer in writers:
+        writer.close()
@@ -3,12 +3,16 @@
 
 import os
 import json
+import threading
 from datetime import datetime
 from typing import List, Dict, Any
 
 # 📁 Absolute path to strategy_log.json
 STRATEGY_LOG_FILE = os.path.join(os.path.dirname(__file__), "..", "strategy_log.json")
 
+# 🔒 Serializes the read-modify-write below when strategies are generated concurrently
+_LOG_LOCK = threading.Lock()
+
 def ensure_log_file_exists():
     """
     Creates the log file with an empty list if it doesn't exist.
@@ -21,39 +25,57 @@ def ensure_log_file_exists():
         except Exception as e:
             print(f"[LOGGER ERROR] Could not create log file: {e}")
 
-def log_strategy(belief: str, explanation: str, user_id: str = "anonymous", strategy: Dict[str, Any] = None):
+def log_strategies(entries, user_id: str = "anonymous"):
     """
-    Appends a strategy entry to strategy_log.json.
+    Appends many strategy entries with one read-modify-write of
+    strategy_log.json, instead of a full rewrite per entry.
 
     Parameters:
-    - belief: User's belief string
-    - explanation: Strategy reasoning
+    - entries: iterable of (belief, explanation, strategy) tuples
     - user_id: Identifier for user
-    - strategy: Dict containing selected strategy
     """
+    timestamp = datetime.utcnow().isoformat()
+    new_logs = [
+        {
+            "timestamp": timestamp,
+            "user_id": user_id,
+            "belief": belief,
+            "explanation": explanation,
+            "strategy": strategy or {}
+        }
+        for belief, explanation, strategy in entries
+    ]
+    if not new_logs:
+        return
+
     ensure_log_file_exists()
 
-    entry = {
-        "timestamp": datetime.utcnow().isoformat(),
-        "user_id": user_id,
-        "belief": belief,
-        "explanation": explanation,
-        "strategy": strategy or {}
-    }
+    with _LOG_LOCK:
+        try:
+            with open(STRATEGY_LOG_FILE, "r") as f:
+                logs = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            logs = []
 
-    try:
-        with open(STRATEGY_LOG_FILE, "r") as f:
-            logs = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        logs = []
+        logs.extend(new_logs)
+
+        try:
+            with open(STRATEGY_LOG_FILE, "w") as f:
+                json.dump(logs, f, indent=2)
+        except Exception as e:
+            print(f"[LOGGER ERROR] Failed to write strategy log: {e}")
 
-    logs.append(entry)
+def log_strategy(belief: str, explanation: str, user_id: str = "anonymous", strategy: Dict[str, Any] = None):
+    """
+    Appends a strategy entry to strategy_log.json.
 
-    try:
-        with open(STRATEGY_LOG_FILE, "w") as f:
-            json.dump(logs, f, indent=2)
-    except Exception as e:
-        print(f"[LOGGER ERROR] Failed to write strategy log: {e}")
+    Parameters:
+    - belief: User's belief string
+    - explanation: Strategy reasoning
+    - user_id: Identifier for user
+    - strategy: Dict containing selected strategy
+    """
+    log_strategies([(belief, explanation, strategy)], user_id=user_id)
 
 def get_user_strategy_history(user_id: str = "anonymous") -> List[Dict[str, Any]]:
     """
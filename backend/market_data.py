@@ -6,8 +6,8 @@
 import yfinance as yf
 from finnhub_client import get_finnhub_price, get_finnhub_high_low
 import os
-import requests
 from typing import Tuple, Optional  # add
+from backend.utils.http_session import build_session
 from backend.utils.symbol_universe import is_tradable_symbol
 
 
@@ -24,10 +24,15 @@ def _alpaca_headers():
         "accept": "application/json",
     }
 
+# Keep-alive session for every Alpaca data call (one TLS handshake, not one per
+# price lookup). A single retry keeps failures falling through to Finnhub fast.
+_ALPACA_SESSION = build_session(retries=1)
+_ALPACA_SESSION.headers.update(_alpaca_headers())
+
 def _get_latest_price_alpaca(ticker: str) -> float:
     """Last trade from Alpaca data API."""
     url = f"{_ALPACA_DATA_BASE}/v2/stocks/{ticker}/trades/latest"
-    r = requests.get(url, headers=_alpaca_headers(), timeout=5)
+    r = _ALPACA_SESSION.get(url, timeout=5)
     r.raise_for_status()
     data = r.json()
     price = data.get("trade", {}).get("p")
@@ -39,7 +44,7 @@ def _get_weekly_high_low_alpaca(ticker: str) -> Tuple[float, float]:
     """7 daily bars via Alpaca; returns (high,max), (low,min)."""
     url = f"{_ALPACA_DATA_BASE}/v2/stocks/{ticker}/bars"
     params = {"timeframe": "1Day", "limit": 7, "adjustment": "all"}
-    r = requests.get(url, headers=_alpaca_headers(), params=params, timeout=5)
+    r = _ALPACA_SESSION.get(url, params=params, timeout=5)
     r.raise_for_status()
     data = r.json()
     bars = data.get("bars", [])
@@ -3,10 +3,45 @@
 Generate trading strategies based on upcoming market events
 """
 
-from typing import List, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from backend.market_events.event_calendar import MarketEvent, EventType, EventImpact
 from backend.ai_engine.ai_engine import run_ai_engine
 
+# Scenario beliefs are independent AI engine calls, so they run concurrently
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="event-strategy")
+
+# TTL cache for AI engine results keyed by (belief, risk, source). Several
+# scenario beliefs are static strings, so repeat events reuse one result.
+_AI_CACHE_TTL = 3600
+_AI_CACHE_MAXSIZE = 512
+_AI_CACHE: Dict[Tuple[str, str, str], Tuple[float, Dict]] = {}
+_AI_CACHE_LOCK = threading.Lock()
+
+
+def cached_run_ai_engine(belief: str, risk: str, source: str) -> Dict:
+    """
+    run_ai_engine with a per-process TTL cache. Only usable strategies are
+    cached, so failures and empty results are retried on the next call.
+    """
+    key = (belief, risk, source)
+    now = time.monotonic()
+    with _AI_CACHE_LOCK:
+        hit = _AI_CACHE.get(key)
+        if hit and now - hit[0] < _AI_CACHE_TTL:
+            return hit[1]
+
+    result = run_ai_engine(belief, risk, source)
+
+    if result and result.get('strategy'):
+        with _AI_CACHE_LOCK:
+            _AI_CACHE[key] = (now, result)
+            while len(_AI_CACHE) > _AI_CACHE_MAXSIZE:
+                _AI_CACHE.pop(next(iter(_AI_CACHE)))
+    return result
+
 class EventStrategyGenerator:
     """
     Creates trading strategies based on upcoming market events
@@ -31,140 +66,76 @@ class EventStrategyGenerator:
             }
         }
     
+    # (scenario, belief template, risk profile, probability) per event type.
+    # Templates are formatted with the event's `ticker` and `title`.
+    _SCENARIOS = {
+        EventType.EARNINGS: (
+            ("Earnings Beat",
+             "I think {ticker} will beat earnings expectations and provide strong guidance",
+             "moderate", "35%"),
+            ("Earnings Miss",
+             "I expect {ticker} to miss earnings and lower guidance",
+             "moderate", "25%"),
+            ("High Volatility",
+             "{ticker} earnings will create high volatility regardless of direction",
+             "moderate", "40%"),
+        ),
+        EventType.ECONOMIC_DATA: (
+            ("Strong Economic Data",
+             "The upcoming {title} will show strong economic growth",
+             "moderate", "45%"),
+            ("Weak Economic Data",
+             "The {title} will disappoint and show economic weakness",
+             "moderate", "30%"),
+        ),
+        EventType.FED_MEETING: (
+            ("Hawkish Fed",
+             "The Federal Reserve will signal more aggressive rate increases",
+             "conservative", "30%"),
+            ("Dovish Fed",
+             "The Federal Reserve will signal potential rate cuts or pause",
+             "moderate", "35%"),
+        ),
+    }
+
     def generate_event_strategies(self, event: MarketEvent) -> List[Dict]:
         """
         Generate multiple strategy options for a single event
         """
+        templates = self._SCENARIOS.get(event.event_type)
+        if not templates:
+            return []
+
+        scenarios = [
+            (scenario, template.format(ticker=event.company_ticker, title=event.title), risk, probability)
+            for scenario, template, risk, probability in templates
+        ]
+        return self._run_scenarios(event, scenarios)
+
+    def _run_scenarios(self, event: MarketEvent, scenarios: List[Tuple[str, str, str, str]]) -> List[Dict]:
+        """
+        Runs the AI engine for every (scenario, belief, risk, probability)
+        concurrently and assembles the results in scenario order. A failing
+        scenario is logged and skipped without affecting the others.
+        """
+        futures = [
+            (scenario, belief, probability, _EXECUTOR.submit(cached_run_ai_engine, belief, risk, "event_system"))
+            for scenario, belief, risk, probability in scenarios
+        ]
+
         strategies = []
-        
-        if event.event_type == EventType.EARNINGS:
-            strategies.extend(self._generate_earnings_strategies(event))
-        elif event.event_type == EventType.ECONOMIC_DATA:
-            strategies.extend(self._generate_economic_data_strategies(event))
-        elif event.event_type == EventType.FED_MEETING:
-            strategies.extend(self._generate_fed_meeting_strategies(event))
-        
-        return strategies
-    
-    def _generate_earnings_strategies(self, event: MarketEvent) -> List[Dict]:
-        """Generate strategies for earnings events"""
-        strategies = []
-        
-        # Bullish earnings expectation
-        bullish_belief = f"I think {event.company_ticker} will beat earnings expectations and provide strong guidance"
-        try:
-            bullish_strategy = run_ai_engine(bullish_belief, "moderate", "event_system")
-            if bullish_strategy and bullish_strategy.get('strategy'):
-                strategies.append({
-                    "scenario": "Earnings Beat",
-                    "belief": bullish_belief,
-                    "strategy": bullish_strategy,
-                    "probability": "35%",
-                    "event_context": event
-                })
-        except Exception as e:
-            print(f"Error generating bullish earnings strategy: {e}")
-        
-        # Bearish earnings expectation  
-        bearish_belief = f"I expect {event.company_ticker} to miss earnings and lower guidance"
-        try:
-            bearish_strategy = run_ai_engine(bearish_belief, "moderate", "event_system")
-            if bearish_strategy and bearish_strategy.get('strategy'):
-                strategies.append({
-                    "scenario": "Earnings Miss",
-                    "belief": bearish_belief, 
-                    "strategy": bearish_strategy,
-                    "probability": "25%",
-                    "event_context": event
-                })
-        except Exception as e:
-            print(f"Error generating bearish earnings strategy: {e}")
-        
-        # Volatility play
-        volatility_belief = f"{event.company_ticker} earnings will create high volatility regardless of direction"
-        try:
-            vol_strategy = run_ai_engine(volatility_belief, "moderate", "event_system")
-            if vol_strategy and vol_strategy.get('strategy'):
-                strategies.append({
-                    "scenario": "High Volatility",
-                    "belief": volatility_belief,
-                    "strategy": vol_strategy, 
-                    "probability": "40%",
-                    "event_context": event
-                })
-        except Exception as e:
-            print(f"Error generating volatility strategy: {e}")
-        
-        return strategies
-    
-    def _generate_economic_data_strategies(self, event: MarketEvent) -> List[Dict]:
-        """Generate strategies for economic data releases"""
-        strategies = []
-        
-        # Positive economic data scenario
-        positive_belief = f"The upcoming {event.title} will show strong economic growth"
-        try:
-            positive_strategy = run_ai_engine(positive_belief, "moderate", "event_system")
-            if positive_strategy and positive_strategy.get('strategy'):
-                strategies.append({
-                    "scenario": "Strong Economic Data", 
-                    "belief": positive_belief,
-                    "strategy": positive_strategy,
-                    "probability": "45%",
-                    "event_context": event
-                })
-        except Exception as e:
-            print(f"Error generating positive economic strategy: {e}")
-        
-        # Negative economic data scenario
-        negative_belief = f"The {event.title} will disappoint and show economic weakness"
-        try:
-            negative_strategy = run_ai_engine(negative_belief, "moderate", "event_system")
-            if negative_strategy and negative_strategy.get('strategy'):
-                strategies.append({
-                    "scenario": "Weak Economic Data",
-                    "belief": negative_belief,
-                    "strategy": negative_strategy, 
-                    "probability": "30%",
-                    "event_context": event
-                })
-        except Exception as e:
-            print(f"Error generating negative economic strategy: {e}")
-        
-        return strategies
-    
-    def _generate_fed_meeting_strategies(self, event: MarketEvent) -> List[Dict]:
-        """Generate strategies for Federal Reserve meetings"""
-        strategies = []
-        
-        # Hawkish Fed scenario
-        hawkish_belief = "The Federal Reserve will signal more aggressive rate increases"
-        try:
-            hawkish_strategy = run_ai_engine(hawkish_belief, "conservative", "event_system")
-            if hawkish_strategy and hawkish_strategy.get('strategy'):
-                strategies.append({
-                    "scenario": "Hawkish Fed",
-                    "belief": hawkish_belief,
-                    "strategy": hawkish_strategy,
-                    "probability": "30%", 
-                    "event_context": event
-                })
-        except Exception as e:
-            print(f"Error generating hawkish Fed strategy: {e}")
-        
-        # Dovish Fed scenario
-        dovish_belief = "The Federal Reserve will signal potential rate cuts or pause"
-        try:
-            dovish_strategy = run_ai_engine(dovish_belief, "moderate", "event_system")
-            if dovish_strategy and dovish_strategy.get('strategy'):
+        for scenario, belief, probability, future in futures:
+            try:
+                strategy = future.result()
+            except Exception as e:
+                print(f"Error generating {scenario} strategy: {e}")
+                continue
+            if strategy and strategy.get('strategy'):
                 strategies.append({
-                    "scenario": "Dovish Fed",
-                    "belief": dovish_belief,
-                    "strategy": dovish_strategy,
-                    "probability": "35%",
+                    "scenario": scenario,
+                    "belief": belief,
+                    "strategy": strategy,
+                    "probability": probability,
                     "event_context": event
                 })
-        except Exception as e:
-            print(f"Error generating dovish Fed strategy: {e}")
-        
         return strategies
@@ -0,0 +1,140 @@
+# backend/minimal_rss.py
+
+"""
+Minimal RSS 2.0 / Atom reader for the headline workers.
+
+The workers only need each entry's title, summary, publish date, link and
+id, so
+entries are streamed with ElementTree.iterparse and those child elements are
+read directly — no FeedParserDict per entry, no HTML sanitizing, and reading
+stops once `limit` entries have been seen (parse_top_chunks also stops
+downloading there). feedparser is only imported for
+bodies that aren't well-formed XML (e.g. RSS using HTML entities like &nbsp;).
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from itertools import islice
+
+_ENTRY_TAGS = ("item", "entry")
+# Only these children are ever read; anything else (categories, enclosures,
+# authors) is skipped without touching its text
+_WANTED_FIELDS = frozenset((
+    "title", "description", "summary", "content", "pubDate", "published", "updated", "guid", "id",
+))
+
+# Namespaces of the feed formats' own elements. Extension elements such as
+# media:title, dc:title or itunes:summary share local names with the wanted
+# fields and must not shadow them, so only children in these are read.
+_FEED_NAMESPACES = frozenset((
+    "",  # RSS 2.0 (no namespace)
+    "http://www.w3.org/2005/Atom",
+    "http://purl.org/atom/ns#",  # Atom 0.3
+    "http://purl.org/rss/1.0/",  # RSS 1.0 (RDF)
+))
+
+def _split_tag(tag):
+    # Atom (and namespaced RSS) tags look like "{http://www.w3.org/2005/Atom}entry"
+    if not isinstance(tag, str):
+        return None, ""  # comments / processing instructions
+    if tag[:1] == "{":
+        namespace, _, name = tag[1:].partition("}")
+        return namespace, name
+    return "", tag
+
+def _local_name(tag) -> str:
+    return _split_tag(tag)[1]
+
+def _entry_fields(el) -> dict:
+    fields = {}
+    link = ""
+    for child in el:
+        namespace, name = _split_tag(child.tag)
+        if namespace not in _FEED_NAMESPACES:
+            continue
+        if name == "link":
+            # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+            if not link and child.get("rel", "alternate") == "alternate":
+                link = (child.get("href") or child.text or "").strip()
+        elif name in _WANTED_FIELDS and name not in fields:
+            fields[name] = "".join(child.itertext()).strip()
+    return {
+        "title": fields.get("title", ""),
+        "summary": fields.get("description") or fields.get("summary") or fields.get("content") or "",
+        "published": fields.get("pubDate") or fields.get("published") or fields.get("updated") or "",
+        "link": link,
+        "id": fields.get("guid") or fields.get("id") or "",
+    }
+
+def extract_top(body: bytes, limit=None):
+    """
+    Returns [{"title", "summary", "published", "link", "id"}, ...] for the first `limit`
+    entries (all of them when None), or None when `body` isn't well-formed XML.
+    """
+    entries = []
+    try:
+        for _, el in ET.iterparse(io.BytesIO(body), events=("end",)):
+            if _local_name(el.tag) not in _ENTRY_TAGS:
+                continue
+            entries.append(_entry_fields(el))
+            el.clear()
+            if limit is not None and len(entries) >= limit:
+                break
+    except ET.ParseError:
+        return None
+    return entries
+
+def parse_top(body: bytes, limit=None, content_type: str = ""):
+    """
+    Same as extract_top, falling back to feedparser's lenient parser for
+    malformed feeds. Always returns a list.
+    """
+    entries = extract_top(body, limit)
+    if entries is not None:
+        return entries
+
+    import feedparser
+    feed = feedparser.parse(
+        body,
+        response_headers={"content-type": content_type},
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+    return [
+        {
+            "title": entry.get("title", "").strip(),
+            "summary": entry.get("summary", "").strip(),
+            "published": entry.get("published", ""),
+            "link": entry.get("link", ""),
+            "id": entry.get("id", ""),
+        }
+        for entry in islice(feed.entries, limit)
+    ]
+
+def parse_top_chunks(chunks, limit=None, content_type: str = ""):
+    """
+    Same as parse_top, but reads the body from an iterable of byte chunks
+    (e.g. resp.iter_content()) and stops consuming it once `limit` entries
+    have been read, so the rest of a large feed is never downloaded.
+    Malformed bodies are read in full and handed to parse_top.
+    """
+    chunks = iter(chunks)
+    received = []
+    entries = []
+    parser = ET.XMLPullParser(events=("end",))
+    try:
+        for chunk in chunks:
+            received.append(chunk)
+            parser.feed(chunk)
+            for _, el in parser.read_events():
+                if _local_name(el.tag) not in _ENTRY_TAGS:
+                    continue
+                entries.append(_entry_fields(el))
+                el.clear()
+                if limit is not None and len(entries) >= limit:
+                    return entries
+        parser.close()
+    except ET.ParseError:
+        received.extend(chunks)
+        return parse_top(b"".join(received), limit, content_type)
+    return entries
@@ -0,0 +1,25 @@
+# backend/news_config.py
+
+"""
+Shared news-source settings for the headline workers (belief_feeder.py,
+news_scraper.py and news_ingestor.py), so feed URLs live in one place. Tuples: these are
+read-only for the life of the process.
+"""
+
+# Core market feeds polled by every headline worker
+MARKET_RSS_FEEDS = (
+    "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",
+    "https://www.marketwatch.com/rss/topstories",
+    "https://www.cnbc.com/id/100003114/device/rss/rss.html",
+)
+
+# Extra feeds only the scraper pulls (broader coverage, noisier headlines)
+SCRAPER_EXTRA_RSS_FEEDS = (
+    "https://www.investing.com/rss/news_25.rss",
+)
+
+# Identifies our feed requests (sent by every headline worker)
+FEED_USER_AGENT = "MarketPlayground/1.0 (+https://marketplayground-backend.onrender.com)"
+
+# Used by the feeder when every feed comes back empty
+FALLBACK_BELIEF = "I believe the market may react to rising uncertainty."
@@ -4,21 +4,28 @@ News Ingestor (single-cycle)
 - Reads NEWS_SOURCES (comma-separated URLs or JSON array).
 - Pulls Alpaca news when configured via "alpaca:SYMB1|SYMB2|...".
 - Optionally calls your local news_scraper.py if present, to merge custom items.
-- Dedupe + atomic append to backend/news_beliefs.csv.
+- Dedupe (SQLite seen-set) + append to backend/news_beliefs.csv.
 - Writes backend/news_ingestor_metrics.json (atomic).
 - Safe on errors; structured, timestamped stdout logs.
 - Run mode: one cycle only (loop handled by news_ingestor_loop.py).
 """
 
+import asyncio
 import csv
+import io
 import json
+import logging
 import os
 import re
+import sqlite3
 import sys
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Optional deps; we degrade gracefully if missing.
 try:
@@ -27,9 +34,32 @@ except Exception:  # pragma: no cover
     requests = None
 
 try:
-    import feedparser  # RSS/Atom
+    import aiohttp  # concurrent feed downloads
 except Exception:  # pragma: no cover
-    feedparser = None
+    aiohttp = None
+
+try:
+    import orjson  # C JSON codec; stdlib json is the fallback
+except Exception:  # pragma: no cover
+    orjson = None
+
+try:
+    # Shared keep-alive Session factory (needs requests; absent -> plain requests.get)
+    from backend.utils.http_session import build_session
+except Exception:  # pragma: no cover
+    try:
+        from utils.http_session import build_session  # run as backend/news_ingestor.py
+    except Exception:
+        build_session = None
+
+try:
+    from backend.logger.append_writer import get_writer
+    from backend.minimal_rss import parse_top
+    from backend.news_config import FEED_USER_AGENT
+except Exception:  # pragma: no cover
+    from logger.append_writer import get_writer  # run as backend/news_ingestor.py
+    from minimal_rss import parse_top
+    from news_config import FEED_USER_AGENT
 
 # Optional custom scraper module (yours). If present, we can call it.
 CUSTOM_SCRAPER_FUNCS = []
@@ -47,47 +77,104 @@ except Exception:
 BASE_DIR = Path(__file__).resolve().parent
 OUT_CSV = BASE_DIR / "news_beliefs.csv"
 METRICS_JSON = BASE_DIR / "news_ingestor_metrics.json"
-STATE_JSON = BASE_DIR / "news_ingestor_state.json"  # persistent dedupe/last-run
+STATE_JSON = BASE_DIR / "news_ingestor_state.json"  # last-run bookkeeping
+SEEN_DB = BASE_DIR / "news_ingestor_seen.sqlite3"  # persistent dedupe set (append-only)
 
 ALPACA_DATA_BASE = os.getenv("ALPACA_DATA_BASE", "https://data.alpaca.markets")
 ALPACA_API_KEY = os.getenv("ALPACA_API_KEY")
 ALPACA_API_SECRET = os.getenv("ALPACA_API_SECRET")
 
+HTTP_TIMEOUT = float(os.getenv("NEWS_HTTP_TIMEOUT", "10"))
+MAX_CONCURRENCY = max(1, int(os.getenv("NEWS_MAX_CONCURRENCY", "4")))
+
+# One pooled Session for the JSON/Alpaca fetchers: repeat requests to the same
+# host reuse the TCP/TLS connection, and the source pool's threads share it
+HTTP_SESSION = (
+    build_session(pool_connections=MAX_CONCURRENCY, pool_maxsize=MAX_CONCURRENCY, retries=2, backoff_factor=0.2)
+    if build_session is not None else None
+)
+
+# Feeds are fetched with the same explicit agent as the other headline workers
+# (a generic library agent gets bot-blocked or bounced through redirects)
+FEED_HEADERS = {"User-Agent": FEED_USER_AGENT}
+
+def _http_get(url: str, **kwargs):
+    return (HTTP_SESSION or requests).get(url, **kwargs)
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def _log(msg: str):
-    print(f"[{_utc_now_iso()}] [news_ingestor] {msg}", flush=True)
-
-def _atomic_write_text(path: Path, text: str):
+def _build_logger() -> logging.Logger:
+    # %-style lazy formatting: arguments are only rendered for enabled levels
+    log = logging.getLogger("news_ingestor")
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(
+            "[%(asctime)s] [news_ingestor] %(levelname)s %(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%SZ",
+        )
+        formatter.converter = time.gmtime
+        handler.setFormatter(formatter)
+        log.addHandler(handler)
+        log.setLevel(os.getenv("NEWS_LOG_LEVEL", "INFO").upper())
+        log.propagate = False
+    return log
+
+logger = _build_logger()
+
+def _atomic_write_json(path: Path, data: Dict):
+    # Compact: these files are machine-read (pipe through jq to inspect).
+    # orjson encodes straight to bytes (several times faster); stdlib json otherwise
+    if orjson is not None:
+        raw = orjson.dumps(data)
+    else:
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(text)
+    tmp.write_bytes(raw)
     tmp.replace(path)
 
 def _load_state() -> Dict:
     if STATE_JSON.exists():
         try:
-            return json.loads(STATE_JSON.read_text())
+            return _json_loads(STATE_JSON.read_bytes())
         except Exception:
             pass
-    return {"seen_ids": [], "last_run_utc": None}
+    return {"last_run_utc": None}
 
 def _save_state(state: Dict):
-    _atomic_write_text(STATE_JSON, json.dumps(state, indent=2))
-
-def _load_seen_ids() -> set:
-    st = _load_state()
-    return set(st.get("seen_ids", []))
-
-def _remember_ids(new_ids: Iterable[str]):
-    st = _load_state()
-    seen = set(st.get("seen_ids", []))
-    for i in new_ids:
-        if i:
-            seen.add(i)
-    st["seen_ids"] = list(seen)[-100000:]  # cap memory
-    st["last_run_utc"] = _utc_now_iso()
-    _save_state(st)
+    _atomic_write_json(STATE_JSON, state)
+
+def _open_seen_db(state: Dict) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(SEEN_DB))
+    # WAL: a cycle's inserts append to the log instead of rewriting pages in
+    # place, and with synchronous=NORMAL a commit doesn't fsync the main file
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY) WITHOUT ROWID")
+    if conn.execute("SELECT 1 FROM seen LIMIT 1").fetchone() is None:
+        # One-time migration from the old JSON-list state file
+        legacy = [i for i in state.get("seen_ids", []) if i]
+        if legacy:
+            conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((i,) for i in legacy))
+            conn.commit()
+    return conn
+
+def _is_seen(conn: sqlite3.Connection, sid: str) -> bool:
+    # Primary-key lookup: the ID history is never loaded into memory, so a
+    # cycle's cost doesn't grow with it
+    return conn.execute("SELECT 1 FROM seen WHERE id = ?", (sid,)).fetchone() is not None
+
+def _remember_ids(conn: sqlite3.Connection, new_ids: Iterable[str]):
+    # Only this cycle's new IDs are written, in one transaction; existing rows
+    # are never rewritten
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((i,) for i in new_ids if i))
+
+def _persist_state(state: Dict):
+    """Writes the cycle's state (feed validators, last run) once, at the end of main."""
+    state.pop("seen_ids", None)  # migrated to SEEN_DB
+    state["last_run_utc"] = _utc_now_iso()
+    _save_state(state)
 
 def _parse_sources_env() -> List[str]:
     raw = os.getenv("NEWS_SOURCES", "").strip()
@@ -105,65 +192,153 @@ def _parse_sources_env() -> List[str]:
 def _csv_header() -> List[str]:
     return ["timestamp_utc", "story_id", "title", "url", "source", "summary", "tickers"]
 
-def _ensure_csv():
-    if not OUT_CSV.exists():
-        with OUT_CSV.open("w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(_csv_header())
-
 def _atomic_append_rows(rows: List[List[str]]):
-    """Atomic append: read current -> write merged tmp -> replace."""
-    _ensure_csv()
-    with OUT_CSV.open("r", newline="", encoding="utf-8") as rf:
-        existing = rf.read()
-
-    with tempfile.NamedTemporaryFile("w", delete=False, newline="", encoding="utf-8") as tf:
-        tf.write(existing)
-        w = csv.writer(tf)
-        for row in rows:
-            w.writerow(row)
-        tmp_path = Path(tf.name)
-
-    tmp_path.replace(OUT_CSV)
+    """
+    Appends rows in place: the batch (plus the header on first run) is
+    formatted in memory and written with one os.write on an O_APPEND
+    descriptor, then fsynced once per cycle.
+    """
+    out = get_writer(str(OUT_CSV))
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(_csv_header())
+    header = buf.getvalue()
+    w.writerows(rows)
+    out.write(buf.getvalue()[len(header):].encode("utf-8"), header=header.encode("utf-8"))
+    out.sync()
+
+def _json_loads(raw: bytes):
+    """Decodes a JSON response body, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 def _normalize_text(s: Optional[str]) -> str:
+    # str.split() collapses the same whitespace runs as re.sub(r"\s+", " ") + strip, in C
     if not s:
         return ""
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return " ".join(s.split())
+
+# Marker for a feed that answered 304 to our conditional GET: nothing new to parse
+NOT_MODIFIED = object()
+
+async def _download(session, url: str, validators: Dict[str, List[str]]):
+    etag, modified = validators.get(url) or (None, None)
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+    try:
+        async with session.get(url, headers=headers) as resp:
+            if resp.status == 304:
+                return NOT_MODIFIED
+            resp.raise_for_status()
+            body = await resp.read()
+            # Handed back, not stored: see _commit_validators
+            etag, modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            return (body, resp.headers.get("Content-Type", "")), ([etag, modified] if etag or modified else None)
+    except Exception as e:
+        logger.warning("downloading %s: %s", url, e)
+        return None
 
-def _fetch_rss(url: str, timeout: int = 10) -> List[Dict]:
-    if feedparser is None:
-        _log("WARNING: feedparser not installed; skipping RSS/Atom source.")
+async def _download_all(urls: List[str], validators: Dict[str, List[str]]) -> List:
+    # NEWS_MAX_CONCURRENCY caps open sockets, so the Render throttle still holds
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY, limit_per_host=2)
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=FEED_HEADERS) as session:
+        return await asyncio.gather(*(_download(session, url, validators) for url in urls))
+
+def _prefetch_feeds(urls: List[str], validators: Dict[str, List[str]]) -> Tuple[Dict[str, object], Dict[str, Optional[List[str]]]]:
+    """
+    Downloads every feed URL concurrently, so a cycle waits roughly for the
+    slowest feed instead of the sum of all of them. Returns (bodies, fresh):
+    bodies maps url -> (body, content-type), or NOT_MODIFIED when the feed's
+    ETag/Last-Modified still match; failed or skipped downloads are absent
+    and fall back to the per-source fetchers. fresh maps each downloaded url
+    to the validators its response carried (or None), to be stored with
+    _commit_validators once the body has parsed.
+    """
+    urls = list(dict.fromkeys(urls))
+    for url in list(validators):
+        if url not in urls:
+            del validators[url]  # source removed from NEWS_SOURCES
+    if aiohttp is None or not urls:
+        return {}, {}
+    try:
+        results = asyncio.run(_download_all(urls, validators))
+    except Exception as e:
+        logger.warning("concurrent feed download failed: %s", e)
+        return {}, {}
+    bodies, fresh = {}, {}
+    for url, result in zip(urls, results):
+        if result is None:
+            continue
+        if result is NOT_MODIFIED:
+            bodies[url] = NOT_MODIFIED
+        else:
+            bodies[url], fresh[url] = result
+    return bodies, fresh
+
+def _commit_validators(validators: Dict[str, List[str]], url: str, fresh: Dict, entries: List[Dict]):
+    """
+    Stores the ETag/Last-Modified a feed was just downloaded with, but only
+    once its body has parsed into entries. A feed that failed to parse (or
+    came back empty) keeps no validators, so the next cycle downloads and
+    parses it again instead of being answered 304 until the publisher
+    changes it. Feeds not downloaded this cycle keep what they had.
+    """
+    if url not in fresh:
+        return
+    if entries and fresh[url]:
+        validators[url] = fresh[url]
+    else:
+        validators.pop(url, None)
+
+def _fetch_rss(url: str, timeout: int = 10, body: Optional[Tuple[bytes, str]] = None) -> List[Dict]:
+    if body is None and requests is None:
+        logger.warning("requests not installed; skipping RSS/Atom source.")
         return []
     try:
-        parsed = feedparser.parse(url)
+        if body is None:
+            # Not prefetched: download over the pooled Session (gzip is
+            # negotiated by requests) rather than feedparser's own urllib fetch
+            resp = _http_get(url, timeout=timeout, headers=FEED_HEADERS)
+            resp.raise_for_status()
+            body = (resp.content, resp.headers.get("Content-Type", ""))
+        # Stream the body through the C-backed XML reader; only malformed
+        # feeds go through feedparser
+        content, content_type = body
+        entries = parse_top(content, content_type=content_type)
     except Exception as e:
-        _log(f"ERROR parsing feed {url}: {e}")
+        logger.error("parsing feed %s: %s", url, e)
         return []
     out = []
-    for e in parsed.entries:
-        story_id = e.get("id") or e.get("guid") or e.get("link") or e.get("title")
+    for e in entries:
+        story_id = e["id"] or e["link"] or e["title"]
         out.append({
             "story_id": str(story_id) if story_id else None,
-            "title": e.get("title") or "",
-            "url": e.get("link") or "",
+            "title": e["title"],
+            "url": e["link"],
             "source": url,
-            "summary": e.get("summary") or e.get("description") or "",
+            "summary": e["summary"],
             "tickers": [],  # optional enrichment later
         })
     return out
 
-def _fetch_http_json(url: str, timeout: int = 10) -> List[Dict]:
-    if requests is None:
-        _log("WARNING: requests not installed; skipping JSON source.")
+def _fetch_http_json(url: str, timeout: int = 10, body: Optional[Tuple[bytes, str]] = None) -> List[Dict]:
+    if body is None and requests is None:
+        logger.warning("requests not installed; skipping JSON source.")
         return []
     try:
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        data = resp.json()
+        if body is not None:
+            data = _json_loads(body[0])
+        else:
+            resp = _http_get(url, timeout=timeout)
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
     except Exception as e:
-        _log(f"ERROR fetching JSON {url}: {e}")
+        logger.error("fetching JSON %s: %s", url, e)
         return []
     out = []
     if isinstance(data, dict) and "items" in data and isinstance(data["items"], list):
@@ -191,10 +366,10 @@ def _fetch_alpaca_news(symbols: List[str], limit: int = 50, timeout: int = 10) -
     NOTE: This assumes Premium data access is enabled in your Alpaca account.
     """
     if requests is None:
-        _log("WARNING: requests not installed; skipping Alpaca news.")
+        logger.warning("requests not installed; skipping Alpaca news.")
         return []
     if not (ALPACA_API_KEY and ALPACA_API_SECRET):
-        _log("INFO: Alpaca keys not set; skipping Alpaca news.")
+        logger.info("Alpaca keys not set; skipping Alpaca news.")
         return []
     if not symbols:
         return []
@@ -206,11 +381,11 @@ def _fetch_alpaca_news(symbols: List[str], limit: int = 50, timeout: int = 10) -
         "APCA-API-SECRET-KEY": ALPACA_API_SECRET,
     }
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=timeout)
+        resp = _http_get(url, headers=headers, params=params, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
     except Exception as e:
-        _log(f"ERROR fetching Alpaca news: {e}")
+        logger.error("fetching Alpaca news: %s", e)
         return []
 
     items = data.get("news", []) if isinstance(data, dict) else []
@@ -231,97 +406,149 @@ def _fetch_alpaca_news(symbols: List[str], limit: int = 50, timeout: int = 10) -
         })
     return out
 
+# One anchored match classifies a NEWS_SOURCES entry (prefixes are case-sensitive)
+_SOURCE_ENTRY_RE = re.compile(r"alpaca:(?P<syms>.*)|feed://(?P<feed>.*)|https?://", re.DOTALL)
+
+@lru_cache(maxsize=256)
 def _infer_fetcher(entry: str) -> Tuple[str, Dict]:
     """
     Recognizes:
       - "alpaca:SYMB1|SYMB2|..." -> Alpaca news for symbols
       - http(s)://...           -> RSS/Atom (via feedparser) OR JSON (fallback)
       - feed://...              -> treat like RSS
+    Memoized: the loop re-polls the same NEWS_SOURCES every cycle. The
+    returned meta dict is shared between calls and must not be mutated.
     """
-    if entry.startswith("alpaca:"):
-        symbols = [s for s in entry.split(":", 1)[1].split("|") if s]
-        return ("alpaca", {"symbols": symbols})
-    if entry.startswith("feed://"):
-        url = "http://" + entry[len("feed://"):]
-        return ("rss", {"url": url})
-    if entry.startswith("http://") or entry.startswith("https://"):
-        return ("auto", {"url": entry})
-    return ("unknown", {"raw": entry})
-
-def _collect_entries(sources: List[str]) -> List[Dict]:
-    collected: List[Dict] = []
-
-    # 1) Built-in sources
-    for s in sources:
-        kind, meta = _infer_fetcher(s)
-        if kind == "alpaca":
-            entries = _fetch_alpaca_news(meta.get("symbols", []))
-            _log(f"Source alpaca:{'|'.join(meta.get('symbols', []))} -> {len(entries)} items")
-            collected.extend(entries)
-        elif kind == "auto":
-            url = meta["url"]
-            rss_entries = _fetch_rss(url)
-            if rss_entries:
-                _log(f"Source RSS {url} -> {len(rss_entries)} items")
-                collected.extend(rss_entries)
-            else:
-                json_entries = _fetch_http_json(url)
-                _log(f"Source JSON {url} -> {len(json_entries)} items")
-                collected.extend(json_entries)
-        elif kind == "rss":
-            url = meta["url"]
-            rss_entries = _fetch_rss(url)
-            _log(f"Source RSS {url} -> {len(rss_entries)} items")
-            collected.extend(rss_entries)
-        else:
-            _log(f"WARNING: Unrecognized source '{s}', skipping.")
-
-    # 2) Optional custom scraper hook (your news_scraper.py)
-    if CUSTOM_SCRAPER_FUNCS:
-        total_custom = 0
-        for func in CUSTOM_SCRAPER_FUNCS:
+    m = _SOURCE_ENTRY_RE.match(entry)
+    if m is None:
+        return ("unknown", {"raw": entry})
+    if m.group("syms") is not None:
+        return ("alpaca", {"symbols": [s for s in m.group("syms").split("|") if s]})
+    if m.group("feed") is not None:
+        return ("rss", {"url": "http://" + m.group("feed")})
+    return ("auto", {"url": entry})
+
+def _entry_row(it: Dict, ingested_at: str, sid: str) -> List[str]:
+    """CSV row for a new entry, normalized straight from the source dict (no write-back)."""
+    syms = it.get("tickers") or []
+    if not isinstance(syms, list):
+        syms = [str(syms)]
+    return [
+        ingested_at,
+        sid,
+        _normalize_text(it.get("title")),
+        _normalize_text(it.get("url")),
+        _normalize_text(it.get("source")),
+        _normalize_text(it.get("summary")),
+        ";".join(sorted({str(t).upper() for t in syms if str(t).strip()})),
+    ]
+
+_FEED_KINDS = ("auto", "rss")
+
+def _fetch_source(s: str, kind: str, meta: Dict, body=None) -> List[Dict]:
+    """Fetches one built-in source and logs its item count (runs on a pool thread)."""
+    if body is NOT_MODIFIED:
+        logger.info("Source %s not modified since last cycle", meta["url"])
+        return []
+    if kind == "alpaca":
+        entries = _fetch_alpaca_news(meta.get("symbols", []))
+        logger.info("Source alpaca:%s -> %d items", "|".join(meta.get("symbols", [])), len(entries))
+        return entries
+    if kind == "auto":
+        url = meta["url"]
+        rss_entries = _fetch_rss(url, body=body)
+        if rss_entries:
+            logger.info("Source RSS %s -> %d items", url, len(rss_entries))
+            return rss_entries
+        # Same downloaded body, decoded as JSON (no second request)
+        json_entries = _fetch_http_json(url, body=body)
+        logger.info("Source JSON %s -> %d items", url, len(json_entries))
+        return json_entries
+    if kind == "rss":
+        url = meta["url"]
+        rss_entries = _fetch_rss(url, body=body)
+        logger.info("Source RSS %s -> %d items", url, len(rss_entries))
+        return rss_entries
+    logger.warning("Unrecognized source '%s', skipping.", s)
+    return []
+
+def _run_custom_scraper(func) -> List[Dict]:
+    """Calls one custom scraper hook (runs on a pool thread); failures yield no items."""
+    try:
+        custom_items = func()  # must return iterable of dicts
+    except TypeError:
+        # if function expects no args but we passed none (or vice versa), attempt calling with no args
+        custom_items = func()
+    except Exception as e:
+        logger.warning("custom scraper %s failed: %s", func.__name__, e)
+        return []
+    return list(custom_items or [])
+
+def _iter_source_entries(sources: List[str], validators: Dict[str, List[str]]) -> Iterator[Dict]:
+    fetchers = [(s,) + _infer_fetcher(s) for s in sources]
+
+    # Built-in sources and custom scraper hooks are fetched on one pool bounded
+    # by NEWS_MAX_CONCURRENCY. Results are still yielded in NEWS_SOURCES order
+    # (then custom hooks) so dedupe and CSV row order don't depend on which
+    # source answered first.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="news-source") as pool:
+        # Alpaca (and unknown) sources and the custom hooks don't use the feed
+        # prefetch: start them now so their requests overlap the feed downloads
+        futures = {
+            i: pool.submit(_fetch_source, s, kind, meta)
+            for i, (s, kind, meta) in enumerate(fetchers)
+            if kind not in _FEED_KINDS
+        }
+        custom_futures = [pool.submit(_run_custom_scraper, func) for func in CUSTOM_SCRAPER_FUNCS]
+        bodies, fresh = _prefetch_feeds([meta["url"] for _, kind, meta in fetchers if kind in _FEED_KINDS], validators)
+        for i, (s, kind, meta) in enumerate(fetchers):
+            if i not in futures:
+                # Feeds whose prefetch failed fall back to a blocking fetch here
+                futures[i] = pool.submit(_fetch_source, s, kind, meta, bodies.get(meta["url"]))
+
+        # 1) Built-in sources
+        for i, (s, kind, meta) in enumerate(fetchers):
             try:
-                custom_items = func()  # must return iterable of dicts
-            except TypeError:
-                # if function expects no args but we passed none (or vice versa), attempt calling with no args
-                custom_items = func()
+                entries = futures[i].result()
             except Exception as e:
-                _log(f"WARNING: custom scraper {func.__name__} failed: {e}")
-                continue
-
-            mapped = []
-            for it in (custom_items or []):
-                # Map arbitrary dicts into our schema (best-effort)
-                story_id = it.get("story_id") or it.get("id") or it.get("uuid") or it.get("url") or it.get("title")
-                mapped.append({
-                    "story_id": str(story_id) if story_id else None,
-                    "title": it.get("title", ""),
-                    "url": it.get("url", ""),
-                    "source": it.get("source", "custom_scraper"),
-                    "summary": it.get("summary", "") or it.get("description", ""),
-                    "tickers": it.get("tickers", []) or it.get("symbols", []),
-                })
-            total_custom += len(mapped)
-            collected.extend(mapped)
-        _log(f"Custom scraper contributed {total_custom} items")
-
-    # normalize fields
-    for it in collected:
-        it["story_id"] = (it.get("story_id") or "").strip()
-        it["title"] = _normalize_text(it.get("title"))
-        it["url"] = _normalize_text(it.get("url"))
-        it["source"] = _normalize_text(it.get("source"))
-        it["summary"] = _normalize_text(it.get("summary"))
-        syms = it.get("tickers") or []
-        if not isinstance(syms, list):
-            syms = [str(syms)]
-        it["tickers"] = sorted({str(t).upper() for t in syms if str(t).strip()})
-    return collected
+                logger.error("source %s failed: %s", s, e)
+                entries = []
+            if kind in _FEED_KINDS:
+                _commit_validators(validators, meta["url"], fresh, entries)
+            yield from entries
+
+        # 2) Optional custom scraper hook (your news_scraper.py)
+        if custom_futures:
+            total_custom = 0
+            for func, fut in zip(CUSTOM_SCRAPER_FUNCS, custom_futures):
+                try:
+                    custom_items = fut.result()
+                except Exception as e:
+                    logger.warning("custom scraper %s failed: %s", func.__name__, e)
+                    continue
+
+                for it in custom_items:
+                    # Map arbitrary dicts into our schema (best-effort)
+                    story_id = it.get("story_id") or it.get("id") or it.get("uuid") or it.get("url") or it.get("title")
+                    total_custom += 1
+                    yield {
+                        "story_id": str(story_id) if story_id else None,
+                        "title": it.get("title", ""),
+                        "url": it.get("url", ""),
+                        "source": it.get("source", "custom_scraper"),
+                        "summary": it.get("summary", "") or it.get("description", ""),
+                        "tickers": it.get("tickers", []) or it.get("symbols", []),
+                    }
+            logger.info("Custom scraper contributed %d items", total_custom)
+
+def _entry_sid(it: Dict) -> str:
+    """Dedupe key: stripped story_id, else the normalized URL."""
+    return (it.get("story_id") or "").strip() or _normalize_text(it.get("url"))
 
 def _write_metrics(metrics: Dict):
     metrics = dict(metrics)
     metrics["last_run_utc"] = _utc_now_iso()
-    _atomic_write_text(METRICS_JSON, json.dumps(metrics, indent=2))
+    _atomic_write_json(METRICS_JSON, metrics)
 
 def main():
     # Support one-shot invocation, loop is external
@@ -329,7 +556,7 @@ def main():
 
     sources = _parse_sources_env()
     if not sources and not CUSTOM_SCRAPER_FUNCS:
-        _log("INFO: NEWS_SOURCES is empty and no custom scraper detected; nothing to ingest.")
+        logger.info("NEWS_SOURCES is empty and no custom scraper detected; nothing to ingest.")
         _write_metrics({
             "polled_feeds": 0, "fetched": 0, "new_written": 0, "duration_seconds": 0.0,
             "alpaca_enabled": bool(ALPACA_API_KEY and ALPACA_API_SECRET),
@@ -339,37 +566,38 @@ def main():
 
     start_ts = datetime.now(timezone.utc).timestamp()
 
-    entries = _collect_entries(sources)
-    fetched = len(entries)
-    seen = _load_seen_ids()
+    # State is read once here and written once at the end of the cycle
+    state = _load_state()
+    validators = state.setdefault("feed_validators", {})
 
     # dedupe by story_id (fallback to URL if missing)
     new_rows: List[List[str]] = []
     newly_seen: List[str] = []
+    cycle_seen = set()  # IDs accepted this cycle (drops repeats across sources)
+    fetched = 0
+    # One ingest timestamp for every row written this cycle
+    cycle_ts = _utc_now_iso()
+
+    with closing(_open_seen_db(state)) as seen_db:
+        # Entries stream in per source; the key is computed first so already-seen
+        # items (most of them, when polling) skip text normalization entirely
+        for it in _iter_source_entries(sources, validators):
+            fetched += 1
+            sid = _entry_sid(it)
+            if not sid:
+                continue
+            if sid in cycle_seen or _is_seen(seen_db, sid):
+                continue
+            cycle_seen.add(sid)
 
-    for it in entries:
-        sid = it.get("story_id") or it.get("url") or ""
-        if not sid:
-            continue
-        if sid in seen:
-            continue
+            newly_seen.append(sid)
+            new_rows.append(_entry_row(it, cycle_ts, sid))
 
-        newly_seen.append(sid)
-        row = [
-            _utc_now_iso(),
-            sid,
-            it.get("title", ""),
-            it.get("url", ""),
-            it.get("source", ""),
-            it.get("summary", ""),
-            ";".join(it.get("tickers", [])),
-        ]
-        new_rows.append(row)
-
-    new_count = len(new_rows)
-    if new_rows:
-        _atomic_append_rows(new_rows)
-        _remember_ids(newly_seen)
+        new_count = len(new_rows)
+        if new_rows:
+            _atomic_append_rows(new_rows)
+            _remember_ids(seen_db, newly_seen)
+    _persist_state(state)
 
     duration = datetime.now(timezone.utc).timestamp() - start_ts
     _write_metrics({
@@ -381,12 +609,12 @@ def main():
         "custom_scraper": bool(CUSTOM_SCRAPER_FUNCS),
     })
 
-    _log(f"Cycle complete: feeds={len(sources)} fetched={fetched} new={new_count} elapsed={duration:.2f}s")
+    logger.info("Cycle complete: feeds=%d fetched=%d new=%d elapsed=%.2fs", len(sources), fetched, new_count, duration)
     return 0
 
 if __name__ == "__main__":
     try:
         sys.exit(main())
     except KeyboardInterrupt:
-        _log("Interrupted via KeyboardInterrupt.")
+        logger.info("Interrupted via KeyboardInterrupt.")
         sys.exit(130)
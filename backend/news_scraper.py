@@ -2,41 +2,132 @@
 
 import os
 import json
-import feedparser
+import asyncio
+import aiohttp
 from datetime import datetime
-from news_entity_parser import extract_entities_from_belief
+
+try:
+    import orjson  # C JSON codec; stdlib json is the fallback
+except Exception:  # pragma: no cover
+    orjson = None
+
+from minimal_rss import parse_top
+from news_config import FEED_USER_AGENT, MARKET_RSS_FEEDS, SCRAPER_EXTRA_RSS_FEEDS
+from news_entity_parser import extract_entities_batch
 
 # RSS feeds to try
-RSS_FEEDS = [
-    "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",
-    "https://www.cnbc.com/id/100003114/device/rss/rss.html",
-    "https://www.marketwatch.com/rss/topstories",
-    "https://www.investing.com/rss/news_25.rss",
-]
+RSS_FEEDS = MARKET_RSS_FEEDS + SCRAPER_EXTRA_RSS_FEEDS
 
 SAVE_PATH = "backend/news_beliefs.json"
 FALLBACK_PATH = "backend/news_sample_fallback.json"
 
+FETCH_TIMEOUT_SECONDS = 10
+
+# Per-feed ETag/Last-Modified + the titles last parsed from it, so an
+# unchanged feed (HTTP 304) is neither downloaded nor parsed again
+FEED_CACHE_PATH = "backend/logs/scraper_feed_cache.json"
+
+# Marker returned by _download_feed when the server answered 304
+NOT_MODIFIED = object()
+
+def _read_json(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _write_json(path, data, indent=False):
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        raw = json.dumps(data, indent=2 if indent else None).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(raw)
+
+def load_feed_cache():
+    try:
+        return _read_json(FEED_CACHE_PATH)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_feed_cache(cache):
+    os.makedirs(os.path.dirname(FEED_CACHE_PATH), exist_ok=True)
+    tmp_path = FEED_CACHE_PATH + ".tmp"
+    _write_json(tmp_path, cache)
+    os.replace(tmp_path, FEED_CACHE_PATH)
+
+async def _download_feed(session, url, cached):
+    print(f"📡 Fetching: {url}")
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    try:
+        async with session.get(url, headers=headers) as resp:
+            if resp.status == 304:
+                print(f"♻️ Not modified: {url}")
+                return NOT_MODIFIED
+            resp.raise_for_status()
+            validators = {"etag": resp.headers.get("ETag"), "modified": resp.headers.get("Last-Modified")}
+            return await resp.read(), resp.headers.get("Content-Type", ""), validators
+    except Exception as e:
+        print(f"⚠️ Failed to fetch {url}: {e}")
+        return None
+
+def _parse_feed_body(body):
+    if body is None or body is NOT_MODIFIED:
+        return None
+    content, content_type, _ = body
+    # Only titles/dates are used: read them straight off the XML (see minimal_rss)
+    return parse_top(content, content_type=content_type)
+
+async def _fetch_feeds(urls, cache):
+    # Download every feed concurrently on one connection pool, then parse the
+    # bytes in the default thread pool so XML parsing stays off the event loop
+    timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT_SECONDS)
+    headers = {"User-Agent": FEED_USER_AGENT}
+    async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+        bodies = await asyncio.gather(*(_download_feed(session, url, cache.get(url) or {}) for url in urls))
+
+    loop = asyncio.get_running_loop()
+    parsed = await asyncio.gather(*(loop.run_in_executor(None, _parse_feed_body, body) for body in bodies))
+
+    feeds = []
+    for url, body, entries in zip(urls, bodies, parsed):
+        if body is NOT_MODIFIED:
+            entries = cache[url]["entries"]
+        elif entries is not None:
+            cache[url] = dict(body[2], entries=[
+                {"title": e["title"], "published": e["published"]} for e in entries
+            ])
+        feeds.append(entries)
+    return feeds
+
 def fetch_from_rss():
     print()
     beliefs = []
-    for url in RSS_FEEDS:
-        print(f"📡 Fetching: {url}")
-        feed = feedparser.parse(url)
-        if not feed.entries:
+    cache = load_feed_cache()
+    # Results come back in RSS_FEEDS order so output stays deterministic
+    feeds = asyncio.run(_fetch_feeds(RSS_FEEDS, cache))
+    save_feed_cache(cache)
+
+    for entries in feeds:
+        if not entries:
             print("⚠️ No entries found.")
             continue
 
-        for entry in feed.entries:
-            title = entry.get("title", "")
-            published = entry.get("published", str(datetime.utcnow()))
-            parsed = extract_entities_from_belief(title)
-            belief_entry = {
-                "belief": title,
-                "published": published,
-                "entities": parsed,
-            }
-            beliefs.append(belief_entry)
+        for entry in entries:
+            # Untitled items (ads, pinned placeholders) carry no belief text
+            if not entry["title"]:
+                continue
+            beliefs.append({
+                "belief": entry["title"],
+                "published": entry["published"] or str(datetime.utcnow()),
+            })
+
+    # One batched spaCy pass over every headline instead of one call per entry
+    for belief_entry, parsed in zip(beliefs, extract_entities_batch(b["belief"] for b in beliefs)):
+        belief_entry["entities"] = parsed
 
     return beliefs
 
@@ -46,14 +137,12 @@ def fetch_news_beliefs():
     if not beliefs:
         print("\n⚠️ RSS failed — using fallback file.")
         if os.path.exists(FALLBACK_PATH):
-            with open(FALLBACK_PATH, "r") as f:
-                beliefs = json.load(f)
+            beliefs = _read_json(FALLBACK_PATH)
         else:
             print("❌ No fallback file found.")
             beliefs = []
 
-    with open(SAVE_PATH, "w") as f:
-        json.dump(beliefs, f, indent=2)
+    _write_json(SAVE_PATH, beliefs, indent=True)
 
     print(f"\n✅ Saved {len(beliefs)} beliefs to {SAVE_PATH}")
     return beliefs
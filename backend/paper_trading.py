@@ -9,6 +9,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
+import time
 import yfinance as yf
 from contextlib import contextmanager
 
@@ -16,6 +17,18 @@ from contextlib import contextmanager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Applied to every connection: WAL (set once in _init_database, persistent)
+# with NORMAL sync skips the per-commit fsync of the rollback journal, and
+# busy_timeout makes writers wait for the lock instead of raising
+# "database is locked"
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA busy_timeout=5000",
+)
+
 class OrderType(Enum):
     MARKET = "market"
     LIMIT = "limit"
@@ -64,12 +77,20 @@ class PaperTradingEngine:
         self.max_position_size = Decimal('0.20')  # 20% max per position
         self.margin_requirement = Decimal('0.25')  # 25% margin for shorts
         self._lock = threading.Lock()
+        self._tls = threading.local()  # per-thread sqlite3 connection (see _get_db_connection)
+        # Live prices reused for a short while: one request (or a burst of
+        # them) no longer re-downloads the same ticker
+        self._price_cache: Dict[str, Tuple[Decimal, float]] = {}  # ticker -> (price, monotonic ts)
+        self._price_ttl = 30.0  # seconds
+        self._price_lock = threading.Lock()
         
         self._init_database()
         
     def _init_database(self):
         """Initialize SQLite database with proper schema"""
         with sqlite3.connect(self.db_path) as conn:
+            # Persistent: readers no longer block on writers (and vice versa)
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     user_id TEXT PRIMARY KEY,
@@ -127,79 +148,204 @@ class PaperTradingEngine:
                 )
             """)
             
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS transactions (
-                    transaction_id TEXT PRIMARY KEY,
-                    user_id TEXT NOT NULL,
-                    order_id TEXT NOT NULL,
-                    ticker TEXT NOT NULL,
-                    transaction_type TEXT NOT NULL,  -- BUY, SELL, DIVIDEND, FEE
-                    quantity INTEGER NOT NULL,
-                    price DECIMAL(10,4) NOT NULL,
-                    amount DECIMAL(15,2) NOT NULL,
-                    commission DECIMAL(8,2) NOT NULL,
-                    net_amount DECIMAL(15,2) NOT NULL,
-                    executed_at TIMESTAMP NOT NULL,
-                    FOREIGN KEY (user_id) REFERENCES users (user_id),
-                    FOREIGN KEY (order_id) REFERENCES orders (order_id)
-                )
-            """)
+            self._create_transactions_table(conn)
+            
+            self._create_market_data_table(conn)
             
+            # Latest known price per ticker (one row each, overwritten in place)
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS market_data (
-                    ticker TEXT NOT NULL,
+                CREATE TABLE IF NOT EXISTS market_snapshot (
+                    ticker TEXT PRIMARY KEY,
                     price DECIMAL(10,4) NOT NULL,
-                    bid DECIMAL(10,4),
-                    ask DECIMAL(10,4),
-                    volume INTEGER,
-                    timestamp TIMESTAMP NOT NULL,
-                    PRIMARY KEY (ticker, timestamp)
-                )
+                    updated_at TIMESTAMP NOT NULL
+                ) WITHOUT ROWID
             """)
+            # One-time seed from the legacy market_data log (newest row per ticker)
+            if conn.execute("SELECT 1 FROM market_snapshot LIMIT 1").fetchone() is None:
+                conn.execute("""
+                    INSERT INTO market_snapshot (ticker, price, updated_at)
+                    SELECT ticker, price, MAX(timestamp) FROM market_data GROUP BY ticker
+                """)
             
-            # Create indexes for performance
+            # Create indexes for performance, shaped after the hot queries:
+            # _update_position looks positions up by (user_id, ticker, position_type)
+            # (its user_id prefix also serves the per-user reads), and
+            # evaluate_strategy_performance range-scans opened_at.
+            # market_snapshot is served by its primary key.
             conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_user_status ON orders(user_id, status)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_user ON positions(user_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_user ON transactions(user_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_market_data_ticker ON market_data(ticker)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_user_ticker_type ON positions(user_id, ticker, position_type)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_opened_at ON positions(opened_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_user ON transactions(user_id)")  # (re)built after any rebuild above
+            # Superseded by the composite index / the primary key above
+            conn.execute("DROP INDEX IF EXISTS idx_positions_user")
+            conn.execute("DROP INDEX IF EXISTS idx_market_data_ticker")
             
+    def _create_transactions_table(self, conn):
+        """
+        transactions rows are narrow (no free-text belief) and keyed by a UUID
+        string, so the table is stored WITHOUT ROWID: each insert writes the
+        primary-key B-tree only, instead of a rowid table plus the unique
+        index behind TEXT PRIMARY KEY. Databases created with the older rowid
+        layout are rebuilt once.
+        """
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'transactions'"
+        ).fetchone()
+        if existing and "WITHOUT ROWID" in existing[0].upper():
+            return
+        conn.execute("""
+            CREATE TABLE transactions_new (
+                transaction_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                order_id TEXT NOT NULL,
+                ticker TEXT NOT NULL,
+                transaction_type TEXT NOT NULL,  -- BUY, SELL, DIVIDEND, FEE
+                quantity INTEGER NOT NULL,
+                price DECIMAL(10,4) NOT NULL,
+                amount DECIMAL(15,2) NOT NULL,
+                commission DECIMAL(8,2) NOT NULL,
+                net_amount DECIMAL(15,2) NOT NULL,
+                executed_at TIMESTAMP NOT NULL,
+                FOREIGN KEY (user_id) REFERENCES users (user_id),
+                FOREIGN KEY (order_id) REFERENCES orders (order_id)
+            ) WITHOUT ROWID
+        """)
+        if existing:
+            conn.execute("""
+                INSERT INTO transactions_new
+                (transaction_id, user_id, order_id, ticker, transaction_type,
+                 quantity, price, amount, commission, net_amount, executed_at)
+                SELECT transaction_id, user_id, order_id, ticker, transaction_type,
+                       quantity, price, amount, commission, net_amount, executed_at
+                FROM transactions
+            """)
+            conn.execute("DROP TABLE transactions")  # also drops idx_transactions_user
+        conn.execute("ALTER TABLE transactions_new RENAME TO transactions")
+    
+    def _create_market_data_table(self, conn):
+        """
+        Legacy: market_data was the append-only price log behind
+        _get_cached_price. Prices now live in market_snapshot and nothing
+        writes here any more; the table is only read once, to seed
+        market_snapshot on databases that predate it. New databases create it
+        WITHOUT ROWID (narrow rows, natural (ticker, timestamp) key); existing
+        tables are left as they are.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS market_data (
+                ticker TEXT NOT NULL,
+                price DECIMAL(10,4) NOT NULL,
+                bid DECIMAL(10,4),
+                ask DECIMAL(10,4),
+                volume INTEGER,
+                timestamp TIMESTAMP NOT NULL,
+                PRIMARY KEY (ticker, timestamp)
+            ) WITHOUT ROWID
+        """)
+    
     @contextmanager
     def _get_db_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Context manager for this thread's database connection. It is opened
+        once per thread and reused, so short helpers don't pay for
+        connect + PRAGMAs on every call. Nested blocks (e.g. a cached-price
+        lookup while get_portfolio updates positions) share the outer
+        transaction: only the outermost block commits or rolls back.
+        """
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            conn.row_factory = sqlite3.Row
+            self._tls.conn = conn
+            self._tls.depth = 0
+
+        outermost = self._tls.depth == 0
+        self._tls.depth += 1
         try:
             yield conn
-            conn.commit()
+            if outermost:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
+            if outermost:
+                conn.rollback()
+                logger.error(f"Database error: {e}")
             raise
         finally:
-            conn.close()
+            self._tls.depth -= 1
             
+    def _get_fresh_price(self, ticker: str) -> Optional[Decimal]:
+        """Live price fetched within the last self._price_ttl seconds, if any"""
+        with self._price_lock:
+            cached = self._price_cache.get(ticker)
+        if cached and time.monotonic() - cached[1] < self._price_ttl:
+            return cached[0]
+        return None
+    
+    def _store_price(self, ticker: str, price: Decimal) -> None:
+        with self._price_lock:
+            self._price_cache[ticker] = (price, time.monotonic())
+    
     def _get_real_market_price(self, ticker: str) -> Decimal:
         """Fetch real market price using yfinance"""
+        price = self._get_fresh_price(ticker)
+        if price is not None:
+            return price
         try:
             stock = yf.Ticker(ticker)
             data = stock.history(period="1d", interval="1m")
             if not data.empty:
                 latest_price = data['Close'].iloc[-1]
-                return Decimal(str(round(latest_price, 4)))
+                price = Decimal(str(round(latest_price, 4)))
+                self._store_price(ticker, price)
+                return price
         except Exception as e:
             logger.warning(f"Failed to fetch price for {ticker}: {e}")
         
         # Fallback to cached price or default
         return self._get_cached_price(ticker)
     
+    def _get_real_market_prices(self, tickers: List[str]) -> Dict[str, Decimal]:
+        """Fetch real market prices for several tickers with one batched yfinance download"""
+        unique = list(dict.fromkeys(tickers))
+        prices = {}
+        for ticker in unique:
+            price = self._get_fresh_price(ticker)
+            if price is not None:
+                prices[ticker] = price
+        stale = [ticker for ticker in unique if ticker not in prices]
+        if not stale:
+            return prices
+        try:
+            data = yf.download(
+                tickers=stale, period="1d", interval="1m",
+                group_by="ticker", threads=True, progress=False
+            )
+            for ticker in stale:
+                try:
+                    # Per-ticker column groups; a lone ticker may come back flat
+                    frame = data[ticker] if getattr(data.columns, "nlevels", 1) > 1 else data
+                    closes = frame['Close'].dropna()  # rows are the union of all tickers' minutes
+                    if not closes.empty:
+                        prices[ticker] = Decimal(str(round(closes.iloc[-1], 4)))
+                        self._store_price(ticker, prices[ticker])
+                except KeyError:
+                    pass
+        except Exception as e:
+            logger.warning(f"Failed to fetch prices for {stale}: {e}")
+        
+        # Fallback to cached price or default for anything the download missed
+        for ticker in unique:
+            if ticker not in prices:
+                prices[ticker] = self._get_cached_price(ticker)
+        return prices
+    
     def _get_cached_price(self, ticker: str) -> Decimal:
         """Get last cached price from database"""
         with self._get_db_connection() as conn:
             result = conn.execute("""
-                SELECT price FROM market_data 
-                WHERE ticker = ? 
-                ORDER BY timestamp DESC 
-                LIMIT 1
+                SELECT price FROM market_snapshot WHERE ticker = ?
             """, (ticker,)).fetchone()
             
             if result:
@@ -310,49 +456,53 @@ class PaperTradingEngine:
                 # Execute orders
                 executed_orders = []
                 with self._get_db_connection() as conn:
+                    # Take the write lock up front: the whole fill is one transaction
+                    conn.execute("BEGIN IMMEDIATE")
                     for order in orders:
                         # Fill order immediately (paper trading)
                         order.status = OrderStatus.FILLED
                         order.filled_at = datetime.now()
                         order.filled_price = current_price
                         order.filled_quantity = order.quantity
-                        
-                        # Insert order record
-                        conn.execute("""
-                            INSERT INTO orders 
-                            (order_id, user_id, ticker, order_type, position_type, quantity, 
-                             price, status, strategy_id, belief, created_at, filled_at, 
-                             filled_price, filled_quantity, commission)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            order.order_id, order.user_id, order.ticker, 
-                            order.order_type.value, order.position_type.value,
-                            order.quantity, order.price, order.status.value,
-                            order.strategy_id, order.belief, order.created_at,
-                            order.filled_at, order.filled_price, order.filled_quantity,
-                            order.commission
-                        ))
-                        
-                        # Create/update position
-                        self._update_position(conn, order, current_price)
-                        
-                        # Record transaction
-                        transaction_type = "BUY" if order.position_type == PositionType.LONG else "SELL_SHORT"
-                        net_amount = (order.filled_quantity * order.filled_price) + order.commission
-                        
-                        conn.execute("""
-                            INSERT INTO transactions 
-                            (transaction_id, user_id, order_id, ticker, transaction_type,
-                             quantity, price, amount, commission, net_amount, executed_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            str(uuid.uuid4()), order.user_id, order.order_id,
-                            order.ticker, transaction_type, order.filled_quantity,
-                            order.filled_price, order.filled_quantity * order.filled_price,
-                            order.commission, net_amount, order.filled_at
-                        ))
-                        
                         executed_orders.append(order)
+
+                    # Insert order records
+                    conn.executemany("""
+                        INSERT INTO orders 
+                        (order_id, user_id, ticker, order_type, position_type, quantity, 
+                         price, status, strategy_id, belief, created_at, filled_at, 
+                         filled_price, filled_quantity, commission)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, [(
+                        order.order_id, order.user_id, order.ticker, 
+                        order.order_type.value, order.position_type.value,
+                        order.quantity, order.price, order.status.value,
+                        order.strategy_id, order.belief, order.created_at,
+                        order.filled_at, order.filled_price, order.filled_quantity,
+                        order.commission
+                    ) for order in executed_orders])
+
+                    # Create/update positions (in leg order: legs on the same
+                    # position build on each other's averages)
+                    for order in executed_orders:
+                        self._update_position(conn, order, current_price)
+
+                    # Record transactions
+                    conn.executemany("""
+                        INSERT INTO transactions 
+                        (transaction_id, user_id, order_id, ticker, transaction_type,
+                         quantity, price, amount, commission, net_amount, executed_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, [(
+                        str(uuid.uuid4()), order.user_id, order.order_id,
+                        order.ticker,
+                        "BUY" if order.position_type == PositionType.LONG else "SELL_SHORT",
+                        order.filled_quantity,
+                        order.filled_price, order.filled_quantity * order.filled_price,
+                        order.commission,
+                        (order.filled_quantity * order.filled_price) + order.commission,
+                        order.filled_at
+                    ) for order in executed_orders])
                     
                     # Update user cash balance
                     cash_impact = -total_cost if orders[0].position_type == PositionType.LONG else Decimal('0.00')
@@ -421,11 +571,14 @@ class PaperTradingEngine:
             ))
     
     def _cache_market_data(self, ticker: str, price: Decimal):
-        """Cache market data for later use"""
+        """Cache market data for later use (one snapshot row per ticker, not a growing log)"""
         with self._get_db_connection() as conn:
             conn.execute("""
-                INSERT INTO market_data (ticker, price, timestamp)
+                INSERT INTO market_snapshot (ticker, price, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    price = excluded.price,
+                    updated_at = excluded.updated_at
             """, (ticker, price))
     
     def _get_user_data(self, user_id: str) -> Dict:
@@ -459,8 +612,11 @@ class PaperTradingEngine:
             total_equity = Decimal('0.00')
             total_unrealized_pnl = Decimal('0.00')
             
+            # One batched download for every held ticker
+            prices = self._get_real_market_prices([pos['ticker'] for pos in positions])
+            
             for pos in positions:
-                current_price = self._get_real_market_price(pos['ticker'])
+                current_price = prices[pos['ticker']]
                 market_value = Decimal(str(pos['quantity'])) * current_price
                 unrealized_pnl = market_value - (Decimal(str(pos['quantity'])) * Decimal(str(pos['avg_price'])))
 
@@ -644,9 +800,11 @@ class PaperTradingEngine:
                 WHERE opened_at < ?
             """, (cutoff_date,)).fetchall()
             
+            # Get current market prices (one batched download)
+            prices = self._get_real_market_prices([pos['ticker'] for pos in positions])
+            
             for pos in positions:
-                # Get current market price
-                current_price = self._get_real_market_price(pos['ticker'])
+                current_price = prices[pos['ticker']]
                 
                 # Calculate P&L percentage
                 entry_price = Decimal(str(pos['avg_price']))
@@ -11,12 +11,14 @@ from typing import Dict, List
 try:
     from .train_all_models import train_all_models
     from .utils.logger import write_training_log
+    from .logger.append_writer import get_writer
 except ImportError:
     ROOT = Path(__file__).resolve().parents[1]
     if str(ROOT) not in sys.path:
         sys.path.insert(0, str(ROOT))
     from backend.train_all_models import train_all_models
     from backend.utils.logger import write_training_log
+    from backend.logger.append_writer import get_writer
 
 # ── Paths / constants ─────────────────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent
@@ -60,8 +62,8 @@ def log_to_file(message: str):
     line = f"[{ts}] {message}"
     print(line)
     try:
-        with LOG_PATH.open("a") as f:
-            f.write(line + "\n")
+        # Kept-open O_APPEND descriptor: no open/close per line
+        get_writer(str(LOG_PATH)).write((line + "\n").encode("utf-8"))
     except Exception:
         pass
     try:
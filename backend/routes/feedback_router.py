@@ -6,7 +6,9 @@ from typing import Literal
 import json
 import os
 import csv
+import io
 from datetime import datetime
+from backend.logger.append_writer import get_writer
 from backend.schemas import FeedbackRequest
 from backend.belief_parser import parse_belief
 from backend.ai_engine.goal_evaluator import evaluate_goal_from_belief
@@ -19,6 +21,15 @@ FEEDBACK_PATH = os.path.join("backend", "feedback_data.json")
 TRAINING_PATH = os.path.join("backend", "Training_Strategies.csv")
 LOG_PATH = os.path.join("backend", "feedback_log.csv")  # ⬅️ CSV log path
 
+# ✅ Append one CSV row (header on first write) through the shared O_APPEND writer
+def _append_csv_row(path: str, row: dict):
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=row.keys())
+    writer.writeheader()
+    header = buf.getvalue()
+    writer.writerow(row)
+    get_writer(path).write(buf.getvalue()[len(header):].encode("utf-8"), header=header.encode("utf-8"))
+
 # ✅ Save raw JSON feedback
 def save_feedback_entry(data: dict):
     if os.path.exists(FEEDBACK_PATH):
@@ -49,12 +60,7 @@ def append_training_example(belief, strategy, risk_profile):
         "risk_profile": risk_profile
     }
 
-    file_exists = os.path.isfile(TRAINING_PATH)
-    with open(TRAINING_PATH, "a", newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=row.keys())
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+    _append_csv_row(TRAINING_PATH, row)
 
 # ✅ Save flat CSV log of all feedback (good + bad)
 def log_feedback_csv(entry: dict):
@@ -68,12 +74,7 @@ def log_feedback_csv(entry: dict):
         "risk_profile": entry["risk_profile"]
     }
 
-    file_exists = os.path.isfile(LOG_PATH)
-    with open(LOG_PATH, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=row.keys())
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+    _append_csv_row(LOG_PATH, row)
 
 # ✅ POST /submit_feedback
 @router.post("/submit_feedback")
@@ -5,20 +5,30 @@
 submits auto-feedback, and returns the strategy for frontend display.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from typing import List
 
 # ✅ AI and feedback system imports
 from backend.ai_engine.ai_engine import run_ai_engine
-from backend.feedback_handler import save_feedback_entry
+from backend.feedback_handler import save_feedback_entry, save_feedback_batch
 
 router = APIRouter()
 
+# Headlines in one /news/ingest_batch request run through the AI engine on
+# this many threads (same knob as /strategy/process_beliefs_batch)
+BATCH_CONCURRENCY = max(1, int(os.getenv("BELIEF_BATCH_CONCURRENCY", "4")))
+
 # ✅ Define the expected input schema
 class NewsInput(BaseModel):
     title: str
     link: str
 
+class NewsBatchInput(BaseModel):
+    items: List[NewsInput]
+
 # ✅ POST endpoint: /news/ingest
 @router.post("/ingest")
 def ingest_news(news: NewsInput):
@@ -51,3 +61,45 @@ def ingest_news(news: NewsInput):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to ingest news: {str(e)}")
+
+# ✅ POST endpoint: /news/ingest_batch
+@router.post("/ingest_batch")
+def ingest_news_batch(batch: NewsBatchInput):
+    """
+    Same as /news/ingest for many headlines in one request: one round-trip
+    for the caller, headlines run through the AI engine concurrently, and the
+    auto-feedback for the whole batch is saved with a single feedback-file
+    rewrite. Results are aligned with `items`; a failing
+    headline gets an `error` entry without aborting the rest.
+    """
+    user_id = "news_ingestor"
+    results = []
+    feedback_items = []
+
+    def run_one(news: NewsInput):
+        try:
+            return run_ai_engine(belief=news.title.strip(), user_id=user_id), None
+        except Exception as e:
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as executor:
+        outcomes = list(executor.map(run_one, batch.items))
+
+    for news, (strategy_result, error) in zip(batch.items, outcomes):
+        if error is not None:
+            results.append({"title": news.title, "error": str(error)})
+            continue
+        feedback_items.append((news.title.strip(), strategy_result.get("type", "unknown")))
+        results.append({"title": news.title, "strategy": strategy_result})
+
+    # 💾 Stores the same fields as /news/ingest (save_feedback_entry drops its
+    # feedback= kwarg there, so the label is predicted in both paths)
+    try:
+        save_feedback_batch(feedback_items, user_id=user_id, source="news_router")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save news feedback: {str(e)}")
+
+    return {
+        "message": f"News batch ingested: {len(feedback_items)}/{len(batch.items)}",
+        "results": results
+    }
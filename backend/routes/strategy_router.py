@@ -2,13 +2,14 @@
 
 from fastapi import APIRouter, Query, HTTPException
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import math
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from backend.ai_engine.ai_engine import run_ai_engine
-from backend.feedback_handler import save_feedback_entry
-from backend.logger.strategy_logger import log_strategy
+from backend.feedback_handler import save_feedback_entry, save_feedback_batch
+from backend.logger.strategy_logger import log_strategy, log_strategies
 from backend.alpaca_orders import AlpacaExecutor
 from backend.utils.logger import write_training_log
 from backend.strategy_outcome_logger import log_strategy_outcome
@@ -19,6 +20,10 @@ from datetime import datetime
 
 router = APIRouter()
 
+# Beliefs in one /process_beliefs_batch request run through the AI engine on
+# this many threads (engine time is mostly waiting on model/market-data calls)
+BATCH_CONCURRENCY = max(1, int(os.getenv("BELIEF_BATCH_CONCURRENCY", "4")))
+
 def sanitize_json_values(obj):
     """
     Recursively clean inf/nan values that break JSON serialization
@@ -39,6 +44,10 @@ class BeliefRequest(BaseModel):
     user_id: Optional[str] = "anonymous"
     place_order: Optional[bool] = False
 
+class BeliefBatchRequest(BaseModel):
+    beliefs: List[str]
+    user_id: Optional[str] = "news_ingestor"
+
 class FeedbackRequest(BaseModel):
     belief: str
     strategy: Dict[str, Any]
@@ -147,6 +156,66 @@ def process_belief(request: BeliefRequest):
         print(f"🔧 [DEBUG] ERROR! {type(e).__name__}: {str(e)[:50]}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _run_batch_belief(belief: str):
+    """Returns (result, None) or (None, exception) so one failure can't abort the batch."""
+    try:
+        return sanitize_json_values(run_ai_engine(belief)), None
+    except Exception as e:
+        return None, e
+
+@router.post("/process_beliefs_batch")
+def process_beliefs_batch(request: BeliefBatchRequest):
+    """
+    Generates strategies for many beliefs in one request (used by the news
+    ingestion workers instead of one /process_belief POST per headline).
+    Returns a list aligned with `request.beliefs`; a failing belief yields an
+    `error` entry without aborting the rest of the batch.
+    """
+    results = []
+    feedback_items = []
+    generated = 0
+
+    with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as executor:
+        outcomes = list(executor.map(_run_batch_belief, request.beliefs))
+
+    # Results are collected on the request thread, in input order
+    for belief, (result, error) in zip(request.beliefs, outcomes):
+        if error is not None:
+            print(f"⚠️ Batch belief failed: {belief[:60]} — {error}")
+            results.append({"belief": belief, "error": str(error)})
+            continue
+        result["user_id"] = request.user_id
+        feedback_items.append((belief, result))
+        results.append({"belief": belief, "result": result})
+        generated += 1
+
+    # 📝 One strategy_log.json rewrite for the whole batch
+    try:
+        log_strategies(
+            [(belief, result.get("explanation", "No explanation"), result.get("strategy", {}))
+             for belief, result in feedback_items],
+            user_id=request.user_id
+        )
+    except Exception as e:
+        print(f"⚠️ Batch strategy log failed: {e}")
+
+    # 💾 All auto-generated feedback for the batch in one JSON rewrite + CSV append
+    try:
+        save_feedback_batch(feedback_items, feedback="auto_generated", user_id=request.user_id)
+    except Exception as e:
+        print(f"⚠️ Batch feedback save failed: {e}")
+
+    # 🗂️ One training-log entry (and Supabase POST) per batch, not per belief
+    try:
+        write_training_log(
+            message=f"[STRATEGY BATCH]\nUser: {request.user_id}\nGenerated: {generated}/{len(request.beliefs)}",
+            source="strategy_router"
+        )
+    except Exception as e:
+        print(f"[SUPABASE LOG ERROR] {e}")
+
+    return {"results": results, "generated": generated}
+
 @router.post("/submit_feedback")
 def submit_feedback(request: FeedbackRequest):
     """
@@ -6,11 +6,14 @@ Includes summary statistics for dashboards or leaderboards.
 """
 
 import csv
+import io
 import os
 from datetime import datetime
 from typing import List, Dict, Optional
 from collections import Counter
 
+from backend.logger.append_writer import get_writer
+
 # 📍 CSV log file path
 OUTCOME_LOG = os.path.join(os.path.dirname(__file__), "strategy_outcomes.csv")
 
@@ -42,13 +45,15 @@ def log_strategy_outcome(strategy: dict, belief: str, ticker: str, pnl_percent:
         "notes": notes
     }
 
-    file_exists = os.path.isfile(OUTCOME_LOG)
-    with open(OUTCOME_LOG, mode="a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=log_entry.keys())
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(log_entry)
-        print(f"✅ Strategy outcome logged:\n{log_entry}")
+    # Assemble the row and append it in one write; the writer adds the header
+    # only if the file is still empty
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=log_entry.keys())
+    writer.writeheader()
+    header = buf.getvalue()
+    writer.writerow(log_entry)
+    get_writer(OUTCOME_LOG).write(buf.getvalue()[len(header):].encode("utf-8"), header=header.encode("utf-8"))
+    print(f"✅ Strategy outcome logged:\n{log_entry}")
 
 def get_all_outcomes() -> List[Dict]:
     """
@@ -0,0 +1,57 @@
+# backend/test_append_writer.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.logger.append_writer import AppendWriter
+
+HEADER = b"a,b\n"
+
+def _append_rows(path, n):
+    writer = AppendWriter(path)
+    for i in range(n):
+        writer.write(b"%d,%d\n" % (os.getpid(), i), header=HEADER)
+    writer.close()
+
+def test_header_written_once(tmp_path):
+    path = str(tmp_path / "out.csv")
+    writer = AppendWriter(path)
+    writer.write(b"1,2\n", header=HEADER)
+    writer.write(b"3,4\n", header=HEADER)
+    writer.close()
+    with open(path, "rb") as f:
+        assert f.read() == b"a,b\n1,2\n3,4\n"
+
+def test_header_written_once_across_processes(tmp_path):
+    path = str(tmp_path / "out.csv")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_append_rows, [path] * 4, [50] * 4))
+    with open(path, "rb") as f:
+        lines = f.read().splitlines(keepends=True)
+    assert lines.count(HEADER) == 1
+    assert lines[0] == HEADER
+    assert len(lines) == 1 + 4 * 50
+
+def test_reopens_after_replace(tmp_path):
+    path = str(tmp_path / "log.txt")
+    writer = AppendWriter(path)
+    writer.write(b"before\n")
+    tmp = str(tmp_path / "log.txt.tmp")
+    with open(tmp, "wb") as f:
+        f.write(b"replaced\n")
+    os.replace(tmp, path)
+    writer.write(b"after\n")
+    writer.close()
+    with open(path, "rb") as f:
+        assert f.read() == b"replaced\nafter\n"
+
+def test_reopens_after_delete_and_rewrites_header(tmp_path):
+    path = str(tmp_path / "out.csv")
+    writer = AppendWriter(path)
+    writer.write(b"1,2\n", header=HEADER)
+    os.remove(path)  # rotated away
+    assert writer.is_empty()
+    writer.write(b"3,4\n", header=HEADER)
+    writer.close()
+    with open(path, "rb") as f:
+        assert f.read() == b"a,b\n3,4\n"
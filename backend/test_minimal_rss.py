@@ -0,0 +1,125 @@
+# backend/test_minimal_rss.py
+
+import pytest
+
+from backend.minimal_rss import extract_top, parse_top, parse_top_chunks
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0">
+  <channel>
+    <title>Markets</title>
+    <item>
+      <title>Stocks rally on rate-cut hopes</title>
+      <link>https://example.com/a</link>
+      <guid>a-1</guid>
+      <description>Indexes climbed.</description>
+      <pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Oil slips</title>
+      <link>https://example.com/b</link>
+    </item>
+  </channel>
+</rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Markets</title>
+  <entry>
+    <title>Fed holds rates</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link href="https://example.com/fed"/>
+    <id>tag:example.com,2025:fed</id>
+    <summary>No change this month.</summary>
+    <updated>2025-01-06T10:00:00Z</updated>
+  </entry>
+</feed>"""
+
+# Extension elements placed before the real ones, as Media RSS / iTunes feeds often do
+NAMESPACED = b"""<?xml version="1.0"?>
+<rss version="2.0"
+     xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <item>
+      <media:title>MEDIA</media:title>
+      <dc:title>DC</dc:title>
+      <itunes:summary>ITUNES</itunes:summary>
+      <media:description>MEDIA DESCRIPTION</media:description>
+      <atom:link rel="self" href="https://example.com/feed.xml"/>
+      <title>Real headline</title>
+      <description>Real summary</description>
+      <link>https://example.com/real</link>
+    </item>
+  </channel>
+</rss>"""
+
+def _rss_with_items(n):
+    items = b"".join(b"<item><title>T%d</title><guid>g%d</guid></item>" % (i, i) for i in range(n))
+    return b"<rss><channel>" + items + b"</channel></rss>"
+
+def test_rss_fields():
+    first, second = extract_top(RSS)
+    assert first == {
+        "title": "Stocks rally on rate-cut hopes",
+        "summary": "Indexes climbed.",
+        "published": "Mon, 06 Jan 2025 10:00:00 GMT",
+        "link": "https://example.com/a",
+        "id": "a-1",
+    }
+    assert second["title"] == "Oil slips"
+    assert second["summary"] == second["published"] == second["id"] == ""
+
+def test_atom_fields():
+    (entry,) = extract_top(ATOM)
+    assert entry == {
+        "title": "Fed holds rates",
+        "summary": "No change this month.",
+        "published": "2025-01-06T10:00:00Z",
+        "link": "https://example.com/fed",  # rel="self" is skipped
+        "id": "tag:example.com,2025:fed",
+    }
+
+def test_extension_namespaces_do_not_shadow_feed_fields():
+    (entry,) = extract_top(NAMESPACED)
+    assert entry["title"] == "Real headline"
+    assert entry["summary"] == "Real summary"
+    assert entry["link"] == "https://example.com/real"
+
+def test_limit_stops_early():
+    assert [e["id"] for e in extract_top(_rss_with_items(50), limit=3)] == ["g0", "g1", "g2"]
+
+def test_malformed_xml_falls_back_to_feedparser():
+    pytest.importorskip("feedparser")
+    body = b"<rss><channel><item><title>A&nbsp;B</title><link>https://example.com/x</link></item></channel></rss>"
+    assert extract_top(body) is None
+    (entry,) = parse_top(body)
+    assert entry["title"] == "A\xa0B"
+    assert entry["link"] == "https://example.com/x"
+
+def test_parse_top_chunks_stops_reading_at_limit():
+    body = _rss_with_items(1000)
+    consumed = []
+
+    def chunks():
+        for i in range(0, len(body), 256):
+            consumed.append(i)
+            yield body[i:i + 256]
+
+    entries = parse_top_chunks(chunks(), limit=5)
+    assert [e["id"] for e in entries] == ["g0", "g1", "g2", "g3", "g4"]
+    assert len(consumed) < len(body) // 256  # the rest of the body was never pulled
+
+def test_parse_top_chunks_matches_parse_top():
+    body = _rss_with_items(20)
+    chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+    assert parse_top_chunks(chunks) == parse_top(body)
+
+def test_parse_top_chunks_malformed_reads_everything():
+    pytest.importorskip("feedparser")
+    items = b"".join(b"<item><title>A&nbsp;%d</title></item>" % i for i in range(3))
+    body = b"<rss><channel>" + items + b"</channel></rss>"
+    chunks = [body[i:i + 10] for i in range(0, len(body), 10)]
+    assert [e["title"] for e in parse_top_chunks(iter(chunks))] == ["A\xa00", "A\xa01", "A\xa02"]
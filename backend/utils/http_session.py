@@ -0,0 +1,45 @@
+# backend/utils/http_session.py
+# ✅ Shared requests.Session with keep-alive pooling + transport-level retries
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSION = None
+
+
+def build_session(pool_connections: int = 4, pool_maxsize: int = 16,
+                  retries: int = 3, backoff_factor: float = 0.3,
+                  status_forcelist=(502, 503, 504),
+                  allowed_methods=Retry.DEFAULT_ALLOWED_METHODS) -> requests.Session:
+    """
+    Creates a Session whose HTTPAdapter keeps TCP/TLS connections alive
+    across calls and retries connection errors / gateway failures.
+    urllib3 only retries idempotent methods on a bad status by default;
+    pass `allowed_methods` including "POST" where a re-send is safe.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=list(status_forcelist),
+            allowed_methods=frozenset(allowed_methods),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the process-wide Session (created on first use), so every POST to
+    the backend or Supabase reuses the same pooled connections.
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = build_session()
+    return _SESSION
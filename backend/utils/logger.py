@@ -3,15 +3,96 @@
 
 import os
 import json
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import orjson  # C JSON encoder for Supabase bodies; stdlib json is the fallback
+except Exception:  # pragma: no cover
+    orjson = None
+
+from backend.logger.append_writer import get_writer
+from backend.utils.http_session import build_session
+
 # ✅ Load environment variables from .env file
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+# ✅ Log locations (directory created once at import, not on every log call)
+LOG_DIR = os.path.join("backend", "logs")
+LAST_TXT_PATH = os.path.join(LOG_DIR, "last_training_log.txt")
+ROLLING_LOG_PATH = os.path.join(LOG_DIR, "retrain_worker.log")
+JSON_LOG_PATH = os.path.join(LOG_DIR, "last_training_log.json")
+os.makedirs(LOG_DIR, exist_ok=True)
+
+# Supabase inserts run here so callers (API requests, the retrain worker) never
+# wait on the network; concurrent.futures drains pending posts at interpreter exit.
+# One worker: rows logged while a POST is in flight coalesce into the next one.
+_SUPABASE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="supabase-log")
+SUPABASE_BATCH_SIZE = 100
+
+# Connection errors and 502/503 from the gateway are retried by urllib3 with
+# backoff on the worker thread. POST is opted in because those statuses mean
+# the insert never reached PostgREST (504 is left out: it may have landed).
+_SUPABASE_SESSION = build_session(
+    pool_connections=1,
+    pool_maxsize=1,
+    retries=2,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503),
+    allowed_methods=("GET", "HEAD", "POST"),
+)
+
+_pending_rows = []
+_pending_lock = threading.Lock()
+_flush_scheduled = False
+
+# Headers are fixed for the process lifetime, so build them once
+_SUPABASE_HEADERS = {
+    "apikey": SUPABASE_KEY or "",
+    "Authorization": f"Bearer {SUPABASE_KEY}",
+    "Content-Type": "application/json",
+    "Prefer": "return=minimal"
+}
+
+def _post_rows(rows: list):
+    # PostgREST inserts a JSON array as one multi-row insert. The body is
+    # serialized here and sent as data= so requests doesn't re-encode it.
+    body = orjson.dumps(rows) if orjson is not None else json.dumps(rows).encode("utf-8")
+    try:
+        response = _SUPABASE_SESSION.post(
+            f"{SUPABASE_URL}/rest/v1/training_logs",
+            headers=_SUPABASE_HEADERS,
+            data=body,
+            timeout=(3, 10)
+        )
+        response.raise_for_status()
+        print(f"✅ Supabase log saved ({len(rows)} rows)")  # ✅ Confirm success in console
+    except Exception as e:
+        print(f"[⚠️ Supabase logging failed] {e}")
+
+def _flush_supabase():
+    global _flush_scheduled
+    with _pending_lock:
+        rows = _pending_rows[:]
+        _pending_rows.clear()
+        _flush_scheduled = False
+    for i in range(0, len(rows), SUPABASE_BATCH_SIZE):
+        _post_rows(rows[i:i + SUPABASE_BATCH_SIZE])
+
+def _queue_supabase_row(row: dict):
+    """Queues one training_logs row; at most one flush is pending at a time."""
+    global _flush_scheduled
+    with _pending_lock:
+        _pending_rows.append(row)
+        if _flush_scheduled:
+            return
+        _flush_scheduled = True
+    _SUPABASE_EXECUTOR.submit(_flush_supabase)
+
 def write_training_log(message: str, source: str = "unknown"):
     """
     Logs training activity to:
@@ -23,50 +104,28 @@ def write_training_log(message: str, source: str = "unknown"):
     timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
     full_message = f"\n🕒 {timestamp} — {source}\n{message}\n"
 
-    # ✅ Make sure logs directory exists
-    log_dir = os.path.join("backend", "logs")
-    os.makedirs(log_dir, exist_ok=True)
-
     # ✅ 1. Save as latest plaintext snapshot
-    last_txt_path = os.path.join(log_dir, "last_training_log.txt")
-    with open(last_txt_path, "w") as f:
+    with open(LAST_TXT_PATH, "w") as f:
         f.write(full_message)
 
-    # ✅ 2. Append to rolling text log
-    rolling_log_path = os.path.join(log_dir, "retrain_worker.log")
-    with open(rolling_log_path, "a") as f:
-        f.write(full_message)
+    # ✅ 2. Append to rolling text log (single O_APPEND write, see append_writer)
+    get_writer(ROLLING_LOG_PATH).write(full_message.encode("utf-8"))
 
     # ✅ 3. Save JSON version for API access
-    json_log_path = os.path.join(log_dir, "last_training_log.json")
-    with open(json_log_path, "w") as f:
+    with open(JSON_LOG_PATH, "w") as f:
         json.dump({
             "timestamp": timestamp,
             "source": source,
             "message": message
         }, f)
 
-    # ✅ 4. Push to Supabase training_logs table
+    # ✅ 4. Push to Supabase training_logs table (fire-and-forget)
     if SUPABASE_URL and SUPABASE_KEY:
-        try:
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/training_logs",
-                headers={
-                    "apikey": SUPABASE_KEY,
-                    "Authorization": f"Bearer {SUPABASE_KEY}",
-                    "Content-Type": "application/json",
-                    "Prefer": "return=minimal"
-                },
-                json={
-                    "created_at": timestamp,
-                    "source": source,
-                    "message": message
-                }
-            )
-            response.raise_for_status()
-            print("✅ Supabase log saved")  # ✅ Confirm success in console
-        except Exception as e:
-            print(f"[⚠️ Supabase logging failed] {e}")
+        _queue_supabase_row({
+            "created_at": timestamp,
+            "source": source,
+            "message": message
+        })
 
     # ✅ Also print to console for Render logs
     print(full_message.strip())
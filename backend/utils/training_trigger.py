@@ -1,7 +1,7 @@
 # backend/utils/training_trigger.py
 # ✅ Triggers retraining by hitting the backend /retrain endpoint
 
-import requests
+from backend.utils.http_session import get_session
 
 RETRAIN_URL = "https://marketplayground-backend.onrender.com/retrain"
 
@@ -10,7 +10,8 @@ def trigger_retraining():
     Sends a POST request to the backend to trigger model retraining.
     """
     try:
-        response = requests.post(RETRAIN_URL)
+        # /retrain trains synchronously, so only bound the connect phase
+        response = get_session().post(RETRAIN_URL, timeout=(3, None))
         if response.status_code == 200:
             print("🚀 Retraining triggered successfully")
         else:
@@ -6,12 +6,17 @@ from datetime import datetime
 
 def run_news_ingestor():
     print(f"\n🕒 Triggered at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    result = subprocess.run(
+    # Forward the ingestor's output line by line as it runs, instead of
+    # buffering the whole cycle's log and printing it after exit
+    with subprocess.Popen(
         ["python", "backend/news_ingestor.py"],
-        capture_output=True,
-        text=True
-    )
-    print(result.stdout)
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            print(line, end="", flush=True)
 
 if __name__ == "__main__":
     while True:
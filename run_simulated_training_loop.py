@@ -10,13 +10,13 @@
 """
 
 import random
-import time
 import subprocess
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from backend.ai_engine.ai_engine import run_ai_engine
-from backend.feedback_trainer import append_feedback_entry
+from backend.feedback_trainer import append_feedback_entries
 from backend.news_scraper import fetch_news_beliefs
 
 # === Templates for synthetic belief generation ===
@@ -48,12 +48,18 @@ def simulate_feedback(result):
         return "good" if random.random() > 0.3 else "bad"
     return "bad"
 
-def run_loop(n=25, include_news=True, retrain=True, log_output=True):
+def _run_engine(belief):
+    try:
+        return run_ai_engine(belief), None
+    except Exception as e:
+        return None, e
+
+def run_loop(n=25, include_news=True, retrain=True, log_output=True, concurrency=4):
     beliefs = []
 
     if include_news:
         news_data = fetch_news_beliefs()
-        news_beliefs = [b["belief"] for b in news_data][:n // 2]
+        news_beliefs = [b["belief"] for b in news_data[:n // 2]]
         beliefs += [(b, "news") for b in news_beliefs]
 
     for _ in range(n - len(beliefs)):
@@ -62,23 +68,35 @@ def run_loop(n=25, include_news=True, retrain=True, log_output=True):
     random.shuffle(beliefs)
     results = []
 
-    for i, (belief, tone) in enumerate(beliefs):
-        print(f"\n🧠 [{i+1}/{n}] Belief: {belief} (Tone: {tone})")
-        try:
-            result = run_ai_engine(belief)
-            label = simulate_feedback(result)
-            append_feedback_entry(belief, result, label)
-            print(f"✅ Logged belief as {label.upper()}")
-            results.append({
-                "belief": belief,
-                "tone": tone,
-                "strategy": result,
-                "feedback": label
-            })
-        except Exception as e:
-            print(f"❌ Error: {e}")
-
-        time.sleep(1)
+    # Engine calls are network-bound (market data, news), so a bounded pool
+    # overlaps them instead of pacing one belief per second. Feedback is
+    # collected on this thread, in belief order, and written once at the end.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        outcomes = executor.map(_run_engine, [belief for belief, _ in beliefs])
+
+        for i, ((belief, tone), (result, error)) in enumerate(zip(beliefs, outcomes)):
+            print(f"\n🧠 [{i+1}/{n}] Belief: {belief} (Tone: {tone})")
+            if error is not None:
+                print(f"❌ Error: {error}")
+                continue
+            try:
+                label = simulate_feedback(result)
+                print(f"✅ Labeled belief as {label.upper()}")
+                results.append({
+                    "belief": belief,
+                    "tone": tone,
+                    "strategy": result,
+                    "feedback": label
+                })
+            except Exception as e:
+                print(f"❌ Error: {e}")
+
+    # One feedback-file rewrite for the whole run instead of one per belief
+    try:
+        append_feedback_entries((r["belief"], r["strategy"], r["feedback"]) for r in results)
+        print(f"\n✅ Logged {len(results)} feedback entries")
+    except Exception as e:
+        print(f"❌ Failed to log feedback entries: {e}")
 
     if log_output:
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -96,11 +114,13 @@ if __name__ == "__main__":
     parser.add_argument("--include_news", action="store_true", help="Include real news beliefs")
     parser.add_argument("--no_retrain", action="store_true", help="Skip model retraining")
     parser.add_argument("--no_log", action="store_true", help="Skip saving output log")
+    parser.add_argument("--concurrency", type=int, default=4, help="Beliefs run through the AI engine at once")
     args = parser.parse_args()
 
     run_loop(
         n=args.n,
         include_news=args.include_news,
         retrain=not args.no_retrain,
-        log_output=not args.no_log
+        log_output=not args.no_log,
+        concurrency=args.concurrency
     )